@@ -4,6 +4,7 @@ import streamlit as st
 import logging
 from pathlib import Path
 
+from src.cache import cached_stats, ensure_app_dirs, start_model_warmup
 from src.config import Config
 
 # Configure logging
@@ -14,6 +15,8 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+ensure_app_dirs()
+
 # Page configuration
 st.set_page_config(
     page_title="Meeting Minutes Generator",
@@ -22,6 +25,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Overlap model loading with the user picking a file
+if Config.WARMUP_MODELS:
+    start_model_warmup()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -139,9 +146,7 @@ def show_home():
     st.markdown("---")
 
     # Get statistics
-    from src.storage import MeetingStorage
-    storage = MeetingStorage()
-    stats = storage.get_statistics()
+    stats = cached_stats()
 
     st.markdown("### 📊 Statistics")
     col1, col2, col3 = st.columns(3)
@@ -2,7 +2,7 @@
 
 import streamlit as st
 import logging
-from src.storage import MeetingStorage
+from src.cache import HISTORY_PAGE_SIZE, get_storage, cached_list_meetings, clear_meeting_caches
 from src.export import DocumentExporter
 from src.schemas import ExportOptions
 
@@ -13,19 +13,32 @@ def show():
     """Show meeting history page."""
     st.title("📋 Meeting History")
 
-    storage = MeetingStorage()
+    storage = get_storage()
 
     # Search bar
     search_query = st.text_input("🔍 Search meetings", placeholder="Search by title or participant...")
 
+    # A new search starts again from the newest meetings
+    if st.session_state.get('history_search') != search_query:
+        st.session_state.history_search = search_query
+        st.session_state.history_cursors = []
+
+    cursors = st.session_state.history_cursors
+    before = cursors[-1] if cursors else None
+
     # Get meetings
-    meetings = storage.list_meetings(limit=50, search=search_query if search_query else None)
+    meetings = cached_list_meetings(search_query if search_query else None, before)
 
     if not meetings:
-        st.info("📭 No meetings found. Create your first meeting!")
-        return
+        if cursors:
+            st.info("📭 No older meetings.")
+        else:
+            st.info("📭 No meetings found. Create your first meeting!")
+            return
+    else:
+        st.markdown(f"### Showing {len(meetings)} meeting(s)")
 
-    st.markdown(f"### Found {len(meetings)} meeting(s)")
+    show_page_controls(meetings, cursors)
 
     # Display meetings
     for meeting in meetings:
@@ -61,17 +74,17 @@ def show():
                             include_speaker_labels=True,
                             format="docx"
                         )
+                        # Listed meetings carry no transcript; load the full record
                         exporter = DocumentExporter()
-                        file_path = exporter.export(meeting, options)
-
-                        with open(file_path, 'rb') as f:
-                            st.download_button(
-                                "⬇️ Download",
-                                f,
-                                file_name=file_path.name,
-                                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                                key=f"download_docx_{meeting.id}"
-                            )
+                        file_name, data = exporter.export_bytes(storage.get_meeting(meeting.id) or meeting, options)
+
+                        st.download_button(
+                            "⬇️ Download",
+                            data,
+                            file_name=file_name,
+                            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                            key=f"download_docx_{meeting.id}"
+                        )
                     except Exception as e:
                         st.error(f"Export failed: {str(e)}")
 
@@ -83,24 +96,46 @@ def show():
                             include_speaker_labels=True,
                             format="pdf"
                         )
+                        # Listed meetings carry no transcript; load the full record
                         exporter = DocumentExporter()
-                        file_path = exporter.export(meeting, options)
-
-                        with open(file_path, 'rb') as f:
-                            st.download_button(
-                                "⬇️ Download",
-                                f,
-                                file_name=file_path.name,
-                                mime="application/pdf",
-                                key=f"download_pdf_{meeting.id}"
-                            )
+                        file_name, data = exporter.export_bytes(storage.get_meeting(meeting.id) or meeting, options)
+
+                        st.download_button(
+                            "⬇️ Download",
+                            data,
+                            file_name=file_name,
+                            mime="application/pdf",
+                            key=f"download_pdf_{meeting.id}"
+                        )
                     except Exception as e:
                         st.error(f"Export failed: {str(e)}")
 
                 # Delete button
                 if st.button("🗑️ Delete", key=f"delete_{meeting.id}"):
                     if storage.delete_meeting(meeting.id):
+                        clear_meeting_caches()
                         st.success("Meeting deleted")
                         st.rerun()
                     else:
                         st.error("Failed to delete meeting")
+
+
+def show_page_controls(meetings, cursors):
+    """Show buttons to page through older meetings.
+
+    Args:
+        meetings: Meetings on the current page
+        cursors: Stack of (date, id) cursors for the pages shown so far
+    """
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if cursors and st.button("⬆️ Newer meetings"):
+            cursors.pop()
+            st.rerun()
+
+    with col2:
+        if len(meetings) == HISTORY_PAGE_SIZE and st.button("⬇️ Older meetings"):
+            last = meetings[-1]
+            cursors.append((last.date, last.id))
+            st.rerun()
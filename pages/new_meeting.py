@@ -1,22 +1,25 @@
 """New meeting page for processing audio and generating minutes."""
 
 import streamlit as st
+import pandas as pd
 import logging
 from pathlib import Path
 from datetime import datetime
 import tempfile
 import shutil
+import time
+from functools import lru_cache
 
 from src.config import Config
 from src.schemas import Meeting, TranscriptSegment, ExportOptions
-from src.transcription import get_transcriber
-from src.diarization import merge_transcript_and_diarization
-from src.summarizer import MeetingSummarizer
-from src.storage import MeetingStorage
-from src.export import DocumentExporter
+from src.cache import get_storage, get_cached_transcriber, get_io_pool, clear_meeting_caches
 
 logger = logging.getLogger(__name__)
 
+# Formats are a set for O(1) membership checks; sort once for display
+UPLOAD_TYPES = sorted(ext.lstrip(".") for ext in Config.SUPPORTED_FORMATS)
+SUPPORTED_FORMATS_LABEL = ", ".join(sorted(Config.SUPPORTED_FORMATS))
+
 
 def show():
     """Show new meeting page."""
@@ -95,13 +98,12 @@ def show_upload_stage():
     # Audio upload
     st.markdown("### Upload Audio File")
 
-    supported_formats = ", ".join(Config.SUPPORTED_FORMATS)
-    st.info(f"📁 Supported formats: {supported_formats}")
+    st.info(f"📁 Supported formats: {SUPPORTED_FORMATS_LABEL}")
     st.info(f"📊 Max file size: {Config.MAX_FILE_SIZE_MB} MB")
 
     uploaded_file = st.file_uploader(
         "Choose an audio file",
-        type=['mp3', 'wav', 'm4a', 'flac', 'ogg']
+        type=UPLOAD_TYPES
     )
 
     if uploaded_file:
@@ -114,12 +116,36 @@ def show_upload_stage():
             st.error(f"❌ File too large. Maximum size is {Config.MAX_FILE_SIZE_MB} MB")
             return
 
-        # Save to temp location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            temp_path = tmp_file.name
+        # Validate file type (the uploader filter can be bypassed by renaming)
+        suffix = Path(uploaded_file.name).suffix.lower()
+        if suffix not in Config.SUPPORTED_FORMATS:
+            st.error(f"❌ Unsupported format. Use one of: {SUPPORTED_FORMATS_LABEL}")
+            return
+
+        # Spool each new upload to disk once, off the script-runner thread
+        if st.session_state.get('upload_file_id') != uploaded_file.file_id:
+            st.session_state.upload_file_id = uploaded_file.file_id
+            st.session_state.temp_audio_path = None
+            st.session_state.upload_future = get_io_pool().submit(
+                spool_upload,
+                uploaded_file,
+                suffix
+            )
 
-        st.session_state.temp_audio_path = temp_path
+        upload_future = st.session_state.upload_future
+
+        if not upload_future.done():
+            st.info("💾 Saving upload...")
+            time.sleep(0.5)
+            st.rerun()
+
+        if upload_future.exception():
+            logger.error(f"Failed to save upload: {upload_future.exception()}")
+            st.error(f"❌ Failed to save upload: {upload_future.exception()}")
+            st.session_state.upload_file_id = None
+            return
+
+        st.session_state.temp_audio_path = upload_future.result()
 
         # Process button
         col1, col2, col3 = st.columns([1, 1, 1])
@@ -157,7 +183,8 @@ def show_transcribe_stage():
             "Number of speakers (optional, helps with diarization)",
             min_value=1,
             max_value=10,
-            value=2
+            value=2,
+            help="Set to 1 for single-speaker recordings to skip speaker detection"
         )
 
     # Start transcription
@@ -165,10 +192,12 @@ def show_transcribe_stage():
         st.session_state.transcription_done = False
 
     if not st.session_state.transcription_done:
+        from src.diarization import merge_transcript_and_diarization
+
         with st.spinner("🎤 Transcribing audio... This may take a few minutes."):
             try:
                 # Transcribe
-                transcriber = get_transcriber(use_fast=use_fast)
+                transcriber = get_cached_transcriber(use_fast)
                 segments, metadata = transcriber.transcribe(
                     st.session_state.temp_audio_path,
                     language=language
@@ -185,6 +214,7 @@ def show_transcribe_stage():
                     )
 
                 st.session_state.transcript_segments = segments
+                st.session_state.preview_text = build_preview_text(segments)
                 st.session_state.transcription_done = True
                 st.rerun()
 
@@ -198,16 +228,10 @@ def show_transcribe_stage():
         st.markdown("### 📄 Transcript Preview")
 
         with st.expander("View Full Transcript", expanded=True):
-            # Display in a nice format
-            current_speaker = None
-            for seg in st.session_state.transcript_segments[:20]:  # Show first 20 segments
-                if seg.speaker != current_speaker:
-                    st.markdown(f"**{seg.speaker}**")
-                    current_speaker = seg.speaker
-
-                timestamp = format_timestamp(seg.start)
-                confidence_emoji = "🟢" if seg.confidence > 0.8 else "🟡" if seg.confidence > 0.5 else "🔴"
-                st.text(f"[{timestamp}] {confidence_emoji} {seg.text}")
+            # Preview is built once per transcript, not on every rerun
+            if not st.session_state.get('preview_text'):
+                st.session_state.preview_text = build_preview_text(st.session_state.transcript_segments)
+            st.text(st.session_state.preview_text)
 
             if len(st.session_state.transcript_segments) > 20:
                 st.info(f"... and {len(st.session_state.transcript_segments) - 20} more segments")
@@ -215,25 +239,27 @@ def show_transcribe_stage():
         # Edit speaker names
         st.markdown("### ✏️ Edit Speaker Names (Optional)")
 
-        unique_speakers = list(set(seg.speaker for seg in st.session_state.transcript_segments))
-
-        speaker_mapping = {}
-        cols = st.columns(min(len(unique_speakers), 3))
+        # Single pass, keeps speakers in order of first appearance
+        unique_speakers = list(dict.fromkeys(seg.speaker for seg in st.session_state.transcript_segments))
 
-        for idx, speaker in enumerate(unique_speakers):
-            col = cols[idx % len(cols)]
-            with col:
-                new_name = st.text_input(
-                    f"Rename {speaker}",
-                    value=speaker,
-                    key=f"speaker_{speaker}"
-                )
-                speaker_mapping[speaker] = new_name
+        speakers_df = pd.DataFrame({"speaker": unique_speakers, "rename_to": unique_speakers})
+        edited_df = st.data_editor(
+            speakers_df,
+            key="speaker_editor",
+            disabled=["speaker"],
+            hide_index=True,
+            use_container_width=True
+        )
 
         # Apply speaker name changes
         if st.button("Apply Speaker Names"):
+            speaker_mapping = {
+                speaker: new_name.strip() or speaker
+                for speaker, new_name in zip(edited_df["speaker"], edited_df["rename_to"].fillna(""))
+            }
             for seg in st.session_state.transcript_segments:
                 seg.speaker = speaker_mapping.get(seg.speaker, seg.speaker)
+            st.session_state.preview_text = build_preview_text(st.session_state.transcript_segments)
             st.success("✅ Speaker names updated")
 
         # Next button
@@ -244,6 +270,23 @@ def show_transcribe_stage():
                 st.rerun()
 
 
+def partial_minutes_preview(placeholder):
+    """Build a callback that shows summary bullets while minutes stream in.
+
+    Args:
+        placeholder: Streamlit placeholder to render into
+
+    Returns:
+        Callback for MeetingSummarizer.summarize's on_partial
+    """
+    def on_partial(data: dict):
+        bullets = [bullet for bullet in data.get("summary", []) if isinstance(bullet, str)]
+        if bullets:
+            placeholder.markdown("\n".join(f"- {bullet}" for bullet in bullets))
+
+    return on_partial
+
+
 def show_minutes_stage():
     """Show minutes generation and editing stage."""
     st.subheader("Step 3: Meeting Minutes")
@@ -254,14 +297,19 @@ def show_minutes_stage():
 
     # Generate minutes if not already done
     if not st.session_state.meeting_minutes:
+        from src.summarizer import MeetingSummarizer
+
         with st.spinner("🤖 Generating meeting minutes... This may take a minute."):
+            preview = st.empty()
             try:
                 summarizer = MeetingSummarizer()
                 minutes = summarizer.summarize(
                     st.session_state.transcript_segments,
-                    meeting_context=st.session_state.meeting_metadata.get('agenda')
+                    meeting_context=st.session_state.meeting_metadata.get('agenda'),
+                    on_partial=partial_minutes_preview(preview)
                 )
 
+                preview.empty()
                 st.session_state.meeting_minutes = minutes
                 st.success("✅ Minutes generated successfully")
 
@@ -357,10 +405,13 @@ def show_minutes_stage():
                 audio_path=st.session_state.temp_audio_path
             )
 
-            storage = MeetingStorage()
+            storage = get_storage()
             meeting_id = storage.save_meeting(meeting)
+            clear_meeting_caches()
+            meeting.id = meeting_id
 
             st.session_state.saved_meeting_id = meeting_id
+            st.session_state.saved_meeting = meeting
             st.session_state.processing_stage = 'export'
             st.rerun()
 
@@ -371,6 +422,16 @@ def show_export_stage():
 
     st.success("✅ Meeting saved successfully!")
 
+    # Reuse the saved meeting for every export instead of rebuilding it per click
+    meeting = st.session_state.get('saved_meeting')
+    if meeting is None:
+        meeting = get_storage().get_meeting(st.session_state.saved_meeting_id)
+        st.session_state.saved_meeting = meeting
+
+    if meeting is None:
+        st.error("❌ Saved meeting not found")
+        return
+
     # Export options
     st.markdown("### 📄 Export Options")
 
@@ -383,6 +444,8 @@ def show_export_stage():
     with col2:
         include_speaker_labels = st.checkbox("Include speaker labels", value=True)
 
+    from src.export import DocumentExporter
+
     # Export buttons
     col1, col2 = st.columns(2)
 
@@ -390,12 +453,6 @@ def show_export_stage():
         if st.button("📄 Export to DOCX", type="primary", use_container_width=True):
             with st.spinner("Generating DOCX..."):
                 try:
-                    meeting = Meeting(
-                        **st.session_state.meeting_metadata,
-                        transcript=st.session_state.transcript_segments,
-                        minutes=st.session_state.meeting_minutes
-                    )
-
                     options = ExportOptions(
                         include_transcript=include_transcript,
                         include_timestamps=include_timestamps,
@@ -404,17 +461,16 @@ def show_export_stage():
                     )
 
                     exporter = DocumentExporter()
-                    file_path = exporter.export(meeting, options)
+                    file_name, data = exporter.export_bytes(meeting, options)
 
-                    with open(file_path, 'rb') as f:
-                        st.download_button(
-                            "⬇️ Download DOCX",
-                            f,
-                            file_name=file_path.name,
-                            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-                        )
+                    st.download_button(
+                        "⬇️ Download DOCX",
+                        data,
+                        file_name=file_name,
+                        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+                    )
 
-                    st.success(f"✅ DOCX generated: {file_path.name}")
+                    st.success(f"✅ DOCX generated: {file_name}")
 
                 except Exception as e:
                     st.error(f"❌ Export failed: {str(e)}")
@@ -423,12 +479,6 @@ def show_export_stage():
         if st.button("📑 Export to PDF", type="primary", use_container_width=True):
             with st.spinner("Generating PDF..."):
                 try:
-                    meeting = Meeting(
-                        **st.session_state.meeting_metadata,
-                        transcript=st.session_state.transcript_segments,
-                        minutes=st.session_state.meeting_minutes
-                    )
-
                     options = ExportOptions(
                         include_transcript=include_transcript,
                         include_timestamps=include_timestamps,
@@ -437,17 +487,16 @@ def show_export_stage():
                     )
 
                     exporter = DocumentExporter()
-                    file_path = exporter.export(meeting, options)
+                    file_name, data = exporter.export_bytes(meeting, options)
 
-                    with open(file_path, 'rb') as f:
-                        st.download_button(
-                            "⬇️ Download PDF",
-                            f,
-                            file_name=file_path.name,
-                            mime="application/pdf"
-                        )
+                    st.download_button(
+                        "⬇️ Download PDF",
+                        data,
+                        file_name=file_name,
+                        mime="application/pdf"
+                    )
 
-                    st.success(f"✅ PDF generated: {file_path.name}")
+                    st.success(f"✅ PDF generated: {file_name}")
 
                 except Exception as e:
                     st.error(f"❌ Export failed: {str(e)}")
@@ -463,12 +512,59 @@ def show_export_stage():
             st.session_state.transcript_segments = []
             st.session_state.meeting_minutes = None
             st.session_state.temp_audio_path = None
+            st.session_state.preview_text = None
+            st.session_state.saved_meeting = None
+            st.session_state.upload_file_id = None
+            st.session_state.upload_future = None
             st.session_state.transcription_done = False
             st.rerun()
 
 
-def format_timestamp(seconds: float) -> str:
-    """Format seconds as MM:SS."""
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
+def spool_upload(uploaded_file, suffix: str) -> str:
+    """Stream an uploaded file to a temporary file on disk.
+
+    Args:
+        uploaded_file: Streamlit UploadedFile
+        suffix: File suffix for the temporary file
+
+    Returns:
+        Path to the temporary file
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+        uploaded_file.seek(0)
+        shutil.copyfileobj(uploaded_file, tmp_file, length=1024 * 1024)
+        return tmp_file.name
+
+
+def build_preview_text(segments, limit: int = 20) -> str:
+    """Render the first transcript segments as a single preview block.
+
+    Args:
+        segments: Transcript segments
+        limit: Number of segments to include
+
+    Returns:
+        Preview text with speaker headers and timestamps
+    """
+    lines = []
+    current_speaker = None
+
+    for seg in segments[:limit]:
+        if seg.speaker != current_speaker:
+            if lines:
+                lines.append("")
+            lines.append(seg.speaker)
+            current_speaker = seg.speaker
+
+        timestamp = format_timestamp(int(seg.start))
+        confidence_emoji = "🟢" if seg.confidence > 0.8 else "🟡" if seg.confidence > 0.5 else "🔴"
+        lines.append(f"[{timestamp}] {confidence_emoji} {seg.text}")
+
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=4096)
+def format_timestamp(seconds: int) -> str:
+    """Format whole seconds as MM:SS."""
+    minutes, secs = divmod(seconds, 60)
     return f"{minutes:02d}:{secs:02d}"
@@ -2,6 +2,13 @@
 
 import streamlit as st
 from src.config import Config
+from src.cache import cached_stats
+
+WHISPER_MODELS = ("tiny", "base", "small", "medium", "large")
+WHISPER_MODEL_INDEX = {model: idx for idx, model in enumerate(WHISPER_MODELS)}
+
+LLM_PROVIDERS = ("openai", "anthropic")
+LLM_PROVIDER_INDEX = {provider: idx for idx, provider in enumerate(LLM_PROVIDERS)}
 
 
 def show():
@@ -27,8 +34,8 @@ def show():
 
     whisper_model = st.selectbox(
         "Whisper Model",
-        options=["tiny", "base", "small", "medium", "large"],
-        index=["tiny", "base", "small", "medium", "large"].index(Config.WHISPER_MODEL),
+        options=WHISPER_MODELS,
+        index=WHISPER_MODEL_INDEX.get(Config.WHISPER_MODEL, 1),
         help="Larger models are more accurate but slower"
     )
 
@@ -47,8 +54,8 @@ def show():
 
     llm_provider = st.selectbox(
         "LLM Provider",
-        options=["openai", "anthropic"],
-        index=0 if Config.LLM_PROVIDER == "openai" else 1,
+        options=LLM_PROVIDERS,
+        index=LLM_PROVIDER_INDEX.get(Config.LLM_PROVIDER, 0),
         help="Provider for summarization and action item extraction"
     )
 
@@ -84,6 +91,9 @@ def show():
 
     st.info(f"**Database Location:** `{Config.STORAGE_PATH}`")
 
+    stats = cached_stats()
+    st.metric("Stored Meetings", stats.get("total_meetings", 0))
+
     audio_retention = st.slider(
         "Audio Retention (days)",
         min_value=0,
@@ -106,7 +116,8 @@ def show():
     with col2:
         st.markdown(f"**Max File Size:** {Config.MAX_FILE_SIZE_MB} MB")
         st.markdown(f"**Audio Retention:** {Config.AUDIO_RETENTION_DAYS} days")
-        st.markdown(f"**Device:** {Config.WHISPER_DEVICE}")
+        st.markdown(f"**Whisper Device:** {Config.resolve_device(Config.WHISPER_DEVICE)}")
+        st.markdown(f"**Diarization Device:** {Config.resolve_device(Config.DIARIZATION_DEVICE)}")
 
     st.markdown("---")
 
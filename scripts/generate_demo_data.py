@@ -9,15 +9,15 @@ from src.storage import MeetingStorage
 def create_demo_meeting_1():
     """Create first demo meeting: Weekly Team Sync."""
     transcript = [
-        TranscriptSegment(start=0.0, end=5.0, text="Good morning everyone, let's start our weekly sync.", speaker="John Smith"),
-        TranscriptSegment(start=5.0, end=12.0, text="Thanks John. I have an update on the Q1 project. We've completed 80% of the deliverables.", speaker="Sarah Johnson"),
-        TranscriptSegment(start=12.0, end=18.0, text="That's excellent progress. What about the remaining 20%?", speaker="John Smith"),
-        TranscriptSegment(start=18.0, end=25.0, text="We're on track to complete everything by end of month. However, we need approval for the extra budget.", speaker="Sarah Johnson"),
-        TranscriptSegment(start=25.0, end=30.0, text="Let's discuss the budget. Bob, can you prepare a proposal?", speaker="John Smith"),
-        TranscriptSegment(start=30.0, end=35.0, text="Sure, I'll have it ready by Friday.", speaker="Bob Wilson"),
-        TranscriptSegment(start=35.0, end=42.0, text="Great. Any blockers or concerns from the team?", speaker="John Smith"),
-        TranscriptSegment(start=42.0, end=48.0, text="We might need additional resources in the final week.", speaker="Sarah Johnson"),
-        TranscriptSegment(start=48.0, end=53.0, text="Noted. Let's plan for that in the budget proposal.", speaker="John Smith"),
+        TranscriptSegment.model_construct(start=0.0, end=5.0, text="Good morning everyone, let's start our weekly sync.", speaker="John Smith"),
+        TranscriptSegment.model_construct(start=5.0, end=12.0, text="Thanks John. I have an update on the Q1 project. We've completed 80% of the deliverables.", speaker="Sarah Johnson"),
+        TranscriptSegment.model_construct(start=12.0, end=18.0, text="That's excellent progress. What about the remaining 20%?", speaker="John Smith"),
+        TranscriptSegment.model_construct(start=18.0, end=25.0, text="We're on track to complete everything by end of month. However, we need approval for the extra budget.", speaker="Sarah Johnson"),
+        TranscriptSegment.model_construct(start=25.0, end=30.0, text="Let's discuss the budget. Bob, can you prepare a proposal?", speaker="John Smith"),
+        TranscriptSegment.model_construct(start=30.0, end=35.0, text="Sure, I'll have it ready by Friday.", speaker="Bob Wilson"),
+        TranscriptSegment.model_construct(start=35.0, end=42.0, text="Great. Any blockers or concerns from the team?", speaker="John Smith"),
+        TranscriptSegment.model_construct(start=42.0, end=48.0, text="We might need additional resources in the final week.", speaker="Sarah Johnson"),
+        TranscriptSegment.model_construct(start=48.0, end=53.0, text="Noted. Let's plan for that in the budget proposal.", speaker="John Smith"),
     ]
 
     minutes = MeetingMinutes(
@@ -55,12 +55,12 @@ def create_demo_meeting_1():
 def create_demo_meeting_2():
     """Create second demo meeting: Sprint Planning."""
     transcript = [
-        TranscriptSegment(start=0.0, end=6.0, text="Let's kick off sprint planning. We have 15 story points committed.", speaker="Alice Chen"),
-        TranscriptSegment(start=6.0, end=13.0, text="I'd like to take the authentication feature. That's 5 points.", speaker="David Lee"),
-        TranscriptSegment(start=13.0, end=19.0, text="Sounds good. I'll handle the API integration, that's 8 points.", speaker="Maria Garcia"),
-        TranscriptSegment(start=19.0, end=25.0, text="That leaves 2 points for the bug fixes. I can take those.", speaker="Tom Brown"),
-        TranscriptSegment(start=25.0, end=32.0, text="Perfect. Any dependencies or blockers we should be aware of?", speaker="Alice Chen"),
-        TranscriptSegment(start=32.0, end=38.0, text="The API integration depends on the infrastructure team. I'll coordinate with them.", speaker="Maria Garcia"),
+        TranscriptSegment.model_construct(start=0.0, end=6.0, text="Let's kick off sprint planning. We have 15 story points committed.", speaker="Alice Chen"),
+        TranscriptSegment.model_construct(start=6.0, end=13.0, text="I'd like to take the authentication feature. That's 5 points.", speaker="David Lee"),
+        TranscriptSegment.model_construct(start=13.0, end=19.0, text="Sounds good. I'll handle the API integration, that's 8 points.", speaker="Maria Garcia"),
+        TranscriptSegment.model_construct(start=19.0, end=25.0, text="That leaves 2 points for the bug fixes. I can take those.", speaker="Tom Brown"),
+        TranscriptSegment.model_construct(start=25.0, end=32.0, text="Perfect. Any dependencies or blockers we should be aware of?", speaker="Alice Chen"),
+        TranscriptSegment.model_construct(start=32.0, end=38.0, text="The API integration depends on the infrastructure team. I'll coordinate with them.", speaker="Maria Garcia"),
     ]
 
     minutes = MeetingMinutes(
@@ -97,11 +97,11 @@ def create_demo_meeting_2():
 def create_demo_meeting_3():
     """Create third demo meeting: Client Kickoff."""
     transcript = [
-        TranscriptSegment(start=0.0, end=7.0, text="Welcome everyone to the project kickoff. Let's start with introductions.", speaker="Project Manager"),
-        TranscriptSegment(start=7.0, end=14.0, text="Hi, I'm the client stakeholder. We're excited about this project.", speaker="Client"),
-        TranscriptSegment(start=14.0, end=21.0, text="Great to meet you. Let's review the timeline. We have 12 weeks for delivery.", speaker="Project Manager"),
-        TranscriptSegment(start=21.0, end=28.0, text="That timeline works for us. What about the budget?", speaker="Client"),
-        TranscriptSegment(start=28.0, end=35.0, text="The budget is $250K as discussed. We'll provide weekly progress reports.", speaker="Project Manager"),
+        TranscriptSegment.model_construct(start=0.0, end=7.0, text="Welcome everyone to the project kickoff. Let's start with introductions.", speaker="Project Manager"),
+        TranscriptSegment.model_construct(start=7.0, end=14.0, text="Hi, I'm the client stakeholder. We're excited about this project.", speaker="Client"),
+        TranscriptSegment.model_construct(start=14.0, end=21.0, text="Great to meet you. Let's review the timeline. We have 12 weeks for delivery.", speaker="Project Manager"),
+        TranscriptSegment.model_construct(start=21.0, end=28.0, text="That timeline works for us. What about the budget?", speaker="Client"),
+        TranscriptSegment.model_construct(start=28.0, end=35.0, text="The budget is $250K as discussed. We'll provide weekly progress reports.", speaker="Project Manager"),
     ]
 
     minutes = MeetingMinutes(
@@ -149,9 +149,9 @@ def main():
         create_demo_meeting_3()
     ]
 
-    # Save to database
-    for meeting in meetings:
-        meeting_id = storage.save_meeting(meeting)
+    # Save to database in one transaction
+    meeting_ids = storage.save_meetings(meetings)
+    for meeting, meeting_id in zip(meetings, meeting_ids):
         print(f"✅ Created meeting: {meeting.title} (ID: {meeting_id})")
 
     # Get statistics
@@ -0,0 +1,120 @@
+"""Audio loading shared by transcription and diarization."""
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Whisper and pyannote.audio both work on 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+
+def load_audio(audio_path: str | Path) -> np.ndarray:
+    """Decode audio file to 16 kHz mono float32 samples.
+
+    Recent decodes are cached by path, modification time and size, so the
+    transcriber and the diarizer share one decode per meeting. The returned
+    array is shared between callers and must not be modified.
+
+    Args:
+        audio_path: Path to audio file
+
+    Returns:
+        Audio samples
+    """
+    path = Path(audio_path).resolve()
+    stat = path.stat()
+    return _decode_audio(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def get_duration(audio_path: str | Path) -> float:
+    """Get audio duration in seconds from the (cached) decoded samples.
+
+    Args:
+        audio_path: Path to audio file
+
+    Returns:
+        Duration in seconds
+    """
+    return len(load_audio(audio_path)) / SAMPLE_RATE
+
+
+def detect_speech(
+    audio: np.ndarray,
+    aggressiveness: int = 2,
+    frame_ms: int = 30,
+    min_silence_ms: int = 500,
+    padding_ms: int = 200
+) -> List[Tuple[int, int]]:
+    """Find speech regions with WebRTC voice activity detection.
+
+    Pauses shorter than min_silence_ms are kept inside a region so sentences
+    aren't cut mid-word.
+
+    Args:
+        audio: 16 kHz mono float32 samples
+        aggressiveness: webrtcvad mode, 0 (keep most) to 3 (drop most)
+        frame_ms: Frame length, 10, 20 or 30 ms
+        min_silence_ms: Shortest pause that splits two regions
+        padding_ms: Audio kept on either side of detected speech
+
+    Returns:
+        (start, end) sample offsets of the speech regions, in order
+    """
+    import webrtcvad
+    vad = webrtcvad.Vad(aggressiveness)
+
+    frame_len = SAMPLE_RATE * frame_ms // 1000
+    frame_bytes = frame_len * 2  # 16-bit PCM
+    min_gap = SAMPLE_RATE * min_silence_ms // 1000
+    pad = SAMPLE_RATE * padding_ms // 1000
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+
+    regions = []
+    for i in range(len(audio) // frame_len):
+        if not vad.is_speech(pcm[i * frame_bytes:(i + 1) * frame_bytes], SAMPLE_RATE):
+            continue
+
+        start = max(0, i * frame_len - pad)
+        end = min(len(audio), (i + 1) * frame_len + pad)
+        if regions and start - regions[-1][1] < min_gap:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+
+    return [(start, end) for start, end in regions]
+
+
+@lru_cache(maxsize=2)
+def _decode_audio(path: str, mtime_ns: int, size: int) -> np.ndarray:
+    """Decode audio file; cache key includes mtime and size.
+
+    Args:
+        path: Resolved path to audio file
+        mtime_ns: File modification time
+        size: File size in bytes
+
+    Returns:
+        Audio samples
+    """
+    logger.info(f"Decoding audio: {Path(path).name}")
+
+    try:
+        import soundfile as sf
+        audio, sample_rate = sf.read(path, dtype="float32", always_2d=True)
+    except (ImportError, RuntimeError):
+        # Formats libsndfile can't read (e.g. m4a) go through librosa/ffmpeg
+        import librosa
+        audio, _ = librosa.load(path, sr=SAMPLE_RATE, mono=True)
+        return audio
+
+    # Recordings already at 16 kHz never import librosa
+    audio = audio.mean(axis=1) if audio.shape[1] > 1 else audio[:, 0]
+    if sample_rate != SAMPLE_RATE:
+        import librosa
+        audio = librosa.resample(audio, orig_sr=sample_rate, target_sr=SAMPLE_RATE)
+    return np.ascontiguousarray(audio)
@@ -0,0 +1,109 @@
+"""Streamlit-cached resources shared across reruns and sessions."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import streamlit as st
+
+from src.config import Config
+from src.schemas import Meeting
+from src.storage import MeetingStorage
+
+
+@st.cache_resource(show_spinner=False)
+def ensure_app_dirs() -> bool:
+    """Create the data directories once per server process, not per rerun.
+
+    Returns:
+        True once the directories exist
+    """
+    Config.ensure_dirs()
+    return True
+
+
+@st.cache_resource
+def get_storage() -> MeetingStorage:
+    """Get the process-wide meeting storage.
+
+    Returns:
+        Shared MeetingStorage instance
+    """
+    return MeetingStorage()
+
+
+HISTORY_PAGE_SIZE = 50
+
+
+@st.cache_data(ttl=30)
+def cached_list_meetings(
+    search: Optional[str] = None,
+    before: Optional[Tuple[datetime, int]] = None
+) -> List[Meeting]:
+    """List meetings through a short-lived cache.
+
+    Args:
+        search: Optional search query
+        before: Optional (date, id) cursor of the previous page's last meeting
+
+    Returns:
+        List of meetings
+    """
+    return get_storage().list_meetings(limit=HISTORY_PAGE_SIZE, search=search, before=before)
+
+
+@st.cache_data(ttl=30)
+def cached_stats() -> dict:
+    """Get database statistics through a short-lived cache.
+
+    Returns:
+        Dictionary with statistics
+    """
+    return get_storage().get_statistics()
+
+
+@st.cache_resource
+def get_cached_transcriber(use_fast: bool = True):
+    """Get a transcriber whose model stays loaded across reruns.
+
+    Args:
+        use_fast: Use faster-whisper if True, else standard whisper
+
+    Returns:
+        Transcriber instance
+    """
+    from src.transcription import get_transcriber
+    from src.warmup import WHISPER_WARMUP, wait_for_warmup
+
+    # Warmup only loads faster-whisper; don't sit out the diarization load,
+    # or any load at all on the openai-whisper path
+    if use_fast:
+        wait_for_warmup(WHISPER_WARMUP)
+    return get_transcriber(use_fast=use_fast)
+
+
+@st.cache_resource
+def start_model_warmup() -> list:
+    """Start loading models in the background, once per server process.
+
+    Returns:
+        The started loader threads
+    """
+    from src.warmup import warm_models
+    return warm_models()
+
+
+@st.cache_resource
+def get_io_pool() -> ThreadPoolExecutor:
+    """Get the shared thread pool for blocking file I/O.
+
+    Returns:
+        ThreadPoolExecutor instance
+    """
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="io")
+
+
+def clear_meeting_caches():
+    """Invalidate cached reads after a write to storage."""
+    cached_list_meetings.clear()
+    cached_stats.clear()
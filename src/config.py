@@ -1,6 +1,8 @@
 """Configuration management for Meeting Minutes Generator."""
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
@@ -9,7 +11,12 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class Config:
-    """Application configuration."""
+    """Application configuration.
+
+    Values are read from the environment (and ``.env``) once, when this
+    module is first imported; attribute access afterwards is a plain class
+    attribute lookup.
+    """
 
     # Paths
     BASE_DIR = Path(__file__).parent.parent
@@ -17,18 +24,21 @@ class Config:
     EXPORTS_DIR = BASE_DIR / "exports"
     AUDIO_DIR = DATA_DIR / "audio"
 
-    # Ensure directories exist
-    DATA_DIR.mkdir(exist_ok=True)
-    EXPORTS_DIR.mkdir(exist_ok=True)
-    AUDIO_DIR.mkdir(exist_ok=True)
-
     # API Keys
     OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
     ANTHROPIC_API_KEY: Optional[str] = os.getenv("ANTHROPIC_API_KEY")
 
     # Whisper Configuration
     WHISPER_MODEL: str = os.getenv("WHISPER_MODEL", "base")
-    WHISPER_DEVICE: str = "cpu"  # "cuda" if GPU available
+    WHISPER_DEVICE: str = os.getenv("WHISPER_DEVICE", "auto")  # auto, cpu, cuda
+    # faster-whisper compute type; empty picks int8 on CPU, int8_float16 on GPU
+    WHISPER_COMPUTE_TYPE: str = os.getenv("WHISPER_COMPUTE_TYPE", "")
+
+    # Diarization Configuration
+    DIARIZATION_DEVICE: str = os.getenv("DIARIZATION_DEVICE", "auto")  # auto, cpu, cuda
+
+    # Load Whisper and diarization models in the background on startup
+    WARMUP_MODELS: bool = os.getenv("WARMUP_MODELS", "true").lower() == "true"
 
     # Privacy Settings
     PRIVACY_MODE: bool = os.getenv("PRIVACY_MODE", "true").lower() == "true"
@@ -42,11 +52,46 @@ class Config:
     LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "openai")
     LLM_MODEL: str = os.getenv("LLM_MODEL", "gpt-4-turbo-preview")
 
+    # Reuse minutes for an identical prompt instead of calling the LLM again.
+    # Off by default: cached minutes live in their own file, keyed by prompt
+    # hash, and are not removed when a meeting is deleted
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+    LLM_CACHE_PATH: Path = Path(os.getenv("LLM_CACHE_PATH", str(DATA_DIR / "llm_cache.db")))
+
+    # Merge speaker turns and strip filler words before sending the transcript
+    AGGRESSIVE_COMPRESSION: bool = os.getenv("AGGRESSIVE_COMPRESSION", "false").lower() == "true"
+
     # Database
     STORAGE_PATH: Path = Path(os.getenv("STORAGE_PATH", str(DATA_DIR / "meetings.db")))
 
     # Supported audio formats
-    SUPPORTED_FORMATS = [".mp3", ".wav", ".m4a", ".flac", ".ogg"]
+    SUPPORTED_FORMATS: frozenset[str] = frozenset({".mp3", ".wav", ".m4a", ".flac", ".ogg"})
+
+    # Filler words, matched as whole words by the transcriber's confidence
+    # heuristic and stripped by transcript compression
+    FILLER_WORDS: tuple[str, ...] = ("um", "uh", "er", "ah")
+
+    @classmethod
+    def filler_pattern(cls, stretched: bool = False) -> str:
+        """Build one regex alternation matching any filler word.
+
+        Args:
+            stretched: Also match drawn-out forms such as "umm" or "uhhh"
+
+        Returns:
+            Regex pattern with word boundaries
+        """
+        # Longest first so multi-word fillers win over their prefixes
+        words = sorted(cls.FILLER_WORDS, key=len, reverse=True)
+        suffix = "+" if stretched else ""
+        alternation = "|".join(re.escape(word) + suffix for word in words)
+        return rf"\b(?:{alternation})\b"
+
+    @classmethod
+    def ensure_dirs(cls):
+        """Create data, exports and audio directories if missing."""
+        for path in (cls.DATA_DIR, cls.EXPORTS_DIR, cls.AUDIO_DIR):
+            path.mkdir(parents=True, exist_ok=True)
 
     @classmethod
     def validate(cls) -> bool:
@@ -59,8 +104,32 @@ class Config:
         return True
 
     @classmethod
+    def resolve_device(cls, device: str) -> str:
+        """Resolve a device setting to a concrete torch device name.
+
+        Args:
+            device: Device setting (auto, cpu, cuda)
+
+        Returns:
+            "cuda" for auto when a GPU is available, else the setting or "cpu"
+        """
+        if device != "auto":
+            return device
+
+        try:
+            import torch
+            return "cuda" if torch.cuda.is_available() else "cpu"
+        except ImportError:
+            return "cpu"
+
+    @classmethod
+    @lru_cache(maxsize=1)
     def get_status_message(cls) -> str:
-        """Get configuration status message."""
+        """Get configuration status message.
+
+        The message is built once per process; call
+        ``Config.get_status_message.cache_clear()`` after changing settings.
+        """
         messages = []
         messages.append(f"Privacy Mode: {'Enabled ✅' if cls.PRIVACY_MODE else 'Disabled ⚠️'}")
         messages.append(f"Whisper Model: {cls.WHISPER_MODEL}")
@@ -1,42 +1,72 @@
 """Speaker diarization for meeting audio."""
 
 import logging
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from src.audio import SAMPLE_RATE, get_duration, load_audio
 from src.config import Config
 from src.schemas import TranscriptSegment
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=2)
+def _get_pipeline(use_auth_token: Optional[str] = None, device: str = "cpu"):
+    """Load the pyannote.audio diarization pipeline once per token and device.
+
+    Args:
+        use_auth_token: HuggingFace token for pyannote.audio models
+        device: Device to run the pipeline on (cpu, cuda)
+
+    Returns:
+        pyannote.audio Pipeline
+    """
+    import torch
+    from pyannote.audio import Pipeline
+    logger.info("Loading pyannote.audio diarization pipeline")
+
+    # Note: Requires HuggingFace token for model access
+    pipeline = Pipeline.from_pretrained(
+        "pyannote/speaker-diarization-3.1",
+        use_auth_token=use_auth_token
+    )
+    if pipeline is None:
+        # from_pretrained returns None instead of raising on gated models
+        raise OSError("Could not download pyannote/speaker-diarization-3.1, check HF_TOKEN")
+    pipeline.to(torch.device(device))
+
+    logger.info(f"Diarization pipeline loaded on {device}")
+    return pipeline
+
+
 class SpeakerDiarizer:
     """Identify and label speakers in audio."""
 
-    def __init__(self, use_auth_token: Optional[str] = None):
+    def __init__(self, use_auth_token: Optional[str] = None, device: Optional[str] = None):
         """Initialize diarizer.
 
         Args:
             use_auth_token: HuggingFace token for pyannote.audio models
+            device: Device to use (auto, cpu, cuda)
         """
         self.use_auth_token = use_auth_token
+        self.device = Config.resolve_device(device or Config.DIARIZATION_DEVICE)
         self.pipeline = None
         self._load_pipeline()
 
     def _load_pipeline(self):
-        """Load pyannote.audio diarization pipeline."""
-        try:
-            from pyannote.audio import Pipeline
-            logger.info("Loading pyannote.audio diarization pipeline")
-
-            # Note: Requires HuggingFace token for model access
-            self.pipeline = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.1",
-                use_auth_token=self.use_auth_token
-            )
+        """Load pyannote.audio diarization pipeline.
 
-            logger.info("Diarization pipeline loaded")
-        except Exception as e:
+        Only a missing package or unavailable model weights select the
+        fallback; anything else is a real bug and propagates.
+        """
+        try:
+            self.pipeline = _get_pipeline(self.use_auth_token, self.device)
+        except (ImportError, OSError) as e:
             logger.warning(f"Could not load pyannote.audio: {e}")
             logger.info("Diarization will use fallback method")
             self.pipeline = None
@@ -57,7 +87,8 @@ class SpeakerDiarizer:
         """
         audio_path = Path(audio_path)
 
-        if self.pipeline is None:
+        # A single known speaker needs no model inference
+        if self.pipeline is None or num_speakers == 1:
             return self._fallback_diarization(audio_path, num_speakers)
 
         try:
@@ -65,7 +96,7 @@ class SpeakerDiarizer:
 
             # Run diarization
             diarization_result = self.pipeline(
-                str(audio_path),
+                self._pipeline_input(audio_path),
                 num_speakers=num_speakers
             )
 
@@ -78,13 +109,32 @@ class SpeakerDiarizer:
                     f"Speaker {speaker}"
                 ))
 
+            speaker_segments = merge_adjacent_turns(speaker_segments)
+
             logger.info(f"Diarization complete: {len(speaker_segments)} speaker turns")
             return speaker_segments
 
-        except Exception as e:
+        except (RuntimeError, OSError, ImportError) as e:
             logger.error(f"Diarization failed: {e}")
             return self._fallback_diarization(audio_path, num_speakers)
 
+    def _pipeline_input(self, audio_path: Path):
+        """Build pipeline input, reusing audio already decoded for transcription.
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            In-memory waveform dict, or the path as string if decoding failed
+        """
+        try:
+            import torch
+            waveform = torch.from_numpy(load_audio(audio_path)).unsqueeze(0)
+            return {"waveform": waveform, "sample_rate": SAMPLE_RATE}
+        except Exception as e:
+            logger.warning(f"Could not reuse decoded audio, passing path to pipeline: {e}")
+            return str(audio_path)
+
     def _fallback_diarization(
         self,
         audio_path: Path,
@@ -94,7 +144,7 @@ class SpeakerDiarizer:
 
         Args:
             audio_path: Path to audio file
-            num_speakers: Number of speakers (ignored in fallback)
+            num_speakers: Number of speakers (only 1 is used, as a single turn)
 
         Returns:
             List of speaker segments
@@ -104,8 +154,10 @@ class SpeakerDiarizer:
         # Simple approach: alternate speakers every 30 seconds
         # User can manually adjust in the UI
         try:
-            import librosa
-            duration = librosa.get_duration(path=str(audio_path))
+            duration = get_duration(audio_path)
+
+            if num_speakers == 1:
+                return [(0.0, duration, "Speaker 1")]
 
             segments = []
             current_time = 0.0
@@ -133,68 +185,125 @@ class SpeakerDiarizer:
         transcript_segments: List[TranscriptSegment],
         speaker_segments: List[Tuple[float, float, str]]
     ) -> List[TranscriptSegment]:
-        """Apply speaker labels to transcript segments.
+        """Apply speaker labels to transcript segments in place.
 
         Args:
             transcript_segments: List of transcript segments
             speaker_segments: List of (start, end, speaker) tuples
 
         Returns:
-            Updated transcript segments with speaker labels
+            The same transcript segments, now with speaker labels
         """
         if not speaker_segments:
             return transcript_segments
 
-        updated_segments = []
-
-        for seg in transcript_segments:
-            # Find overlapping speaker segment
-            speaker = self._find_speaker(
-                seg.start,
-                seg.end,
-                speaker_segments
-            )
+        speakers = self._assign_speakers(transcript_segments, speaker_segments)
 
-            # Update segment with speaker label
-            updated_seg = seg.model_copy()
-            updated_seg.speaker = speaker
-            updated_segments.append(updated_seg)
+        for seg, speaker in zip(transcript_segments, speakers):
+            seg.speaker = speaker
 
-        return updated_segments
+        return transcript_segments
 
-    def _find_speaker(
+    def _assign_speakers(
         self,
-        start: float,
-        end: float,
+        transcript_segments: List[TranscriptSegment],
         speaker_segments: List[Tuple[float, float, str]]
-    ) -> str:
-        """Find the speaker for a given time range.
+    ) -> List[str]:
+        """Find the speaker with maximum overlap for every transcript segment.
 
         Args:
-            start: Start time
-            end: End time
-            speaker_segments: List of speaker segments
+            transcript_segments: List of transcript segments
+            speaker_segments: List of (start, end, speaker) tuples
 
         Returns:
-            Speaker label
+            Speaker label per transcript segment
         """
-        # Find speaker with maximum overlap
-        max_overlap = 0.0
-        best_speaker = "Speaker 1"
+        turn_indices = find_speaker_turns(
+            [(seg.start, seg.end) for seg in transcript_segments],
+            speaker_segments
+        )
 
-        segment_duration = end - start
+        return [
+            speaker_segments[idx][2] if idx >= 0 else "Speaker 1"
+            for idx in turn_indices
+        ]
 
-        for sp_start, sp_end, speaker in speaker_segments:
-            # Calculate overlap
-            overlap_start = max(start, sp_start)
-            overlap_end = min(end, sp_end)
-            overlap = max(0, overlap_end - overlap_start)
 
-            if overlap > max_overlap:
-                max_overlap = overlap
-                best_speaker = speaker
+def merge_adjacent_turns(
+    speaker_segments: List[Tuple[float, float, str]],
+    max_gap: float = 0.3
+) -> List[Tuple[float, float, str]]:
+    """Coalesce consecutive turns by the same speaker.
 
-        return best_speaker
+    pyannote often splits one speaker's turn into sub-second pieces;
+    merging them shrinks the candidate set for overlap matching.
+
+    Args:
+        speaker_segments: List of (start, end, speaker) tuples
+        max_gap: Largest pause in seconds bridged between two turns
+
+    Returns:
+        Merged list of (start, end, speaker) tuples, sorted by start
+    """
+    merged = []
+
+    for start, end, speaker in sorted(speaker_segments):
+        if merged and merged[-1][2] == speaker and start - merged[-1][1] < max_gap:
+            prev_start, prev_end, _ = merged[-1]
+            merged[-1] = (prev_start, max(prev_end, end), speaker)
+        else:
+            merged.append((start, end, speaker))
+
+    return merged
+
+
+def find_speaker_turns(
+    segment_bounds: List[Tuple[float, float]],
+    speaker_segments: List[Tuple[float, float, str]]
+) -> List[int]:
+    """Find the speaker turn with maximum overlap for every time range.
+
+    Keeps only the running best per range, so memory is O(ranges) rather
+    than a ranges x turns overlap matrix.
+
+    Args:
+        segment_bounds: List of (start, end) time ranges
+        speaker_segments: List of (start, end, speaker) tuples
+
+    Returns:
+        Index into speaker_segments per range, -1 when nothing overlaps
+    """
+    # Index turns by start time; reach[i] is the latest end among the
+    # first i+1 turns, so the backward walk can stop as soon as no
+    # earlier turn can still overlap the range
+    order = sorted(range(len(speaker_segments)), key=lambda i: speaker_segments[i][0])
+    starts = [speaker_segments[i][0] for i in order]
+    ends = [speaker_segments[i][1] for i in order]
+    reach = list(accumulate(ends, max))
+
+    turn_indices = []
+
+    for start, end in segment_bounds:
+        best_overlap = 0.0
+        best_turn = -1
+
+        idx = bisect_left(starts, end) - 1
+        while idx >= 0 and reach[idx] > start:
+            # Conditional expressions avoid two builtin calls per candidate
+            turn_start = starts[idx]
+            turn_end = ends[idx]
+            overlap = (end if end < turn_end else turn_end) - (start if start > turn_start else turn_start)
+
+            # Ties go to the turn that came first in the diarization output
+            if overlap > best_overlap or (overlap == best_overlap and best_turn >= 0 and order[idx] < best_turn):
+                best_overlap = overlap
+                best_turn = order[idx]
+
+            idx -= 1
+
+        turn_indices.append(best_turn)
+
+    return turn_indices
 
 
 def merge_transcript_and_diarization(
@@ -214,10 +323,12 @@ def merge_transcript_and_diarization(
     Returns:
         Transcript segments with speaker labels
     """
-    try:
-        diarizer = SpeakerDiarizer(use_auth_token)
-        speaker_segments = diarizer.diarize(audio_path, num_speakers)
-        return diarizer.apply_diarization(transcript_segments, speaker_segments)
-    except Exception as e:
-        logger.error(f"Failed to merge diarization: {e}")
+    # Nothing to tell apart, so skip loading the diarization pipeline
+    if num_speakers == 1:
+        for seg in transcript_segments:
+            seg.speaker = "Speaker 1"
         return transcript_segments
+
+    diarizer = SpeakerDiarizer(use_auth_token)
+    speaker_segments = diarizer.diarize(audio_path, num_speakers)
+    return diarizer.apply_diarization(transcript_segments, speaker_segments)
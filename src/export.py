@@ -1,13 +1,23 @@
 """Export meeting minutes to DOCX and PDF."""
 
 import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from itertools import groupby
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, List, Optional, Tuple, Union
+from xml.sax.saxutils import escape
 
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -19,15 +29,183 @@ from src.schemas import Meeting, ExportOptions
 
 logger = logging.getLogger(__name__)
 
+# Anything but letters, digits, spaces, hyphens and underscores (matches
+# str.isalnum(), including non-ASCII letters)
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w -]+")
+
+# Skip ReportLab's per-attribute validation of graphics shapes
+rl_config.shapeChecking = 0
+
+
+@lru_cache(maxsize=1)
+def _pdf_styles() -> dict:
+    """Build the PDF paragraph styles once per process.
+
+    Returns:
+        Dictionary of ParagraphStyle objects keyed by role
+    """
+    styles = getSampleStyleSheet()
+
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Title'],
+            fontSize=24,
+            textColor=colors.HexColor('#1a1a1a'),
+            spaceAfter=30,
+            alignment=1  # Center
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading1'],
+            fontSize=16,
+            textColor=colors.HexColor('#0066cc'),
+            spaceAfter=12,
+            spaceBefore=12
+        ),
+        'bullet': ParagraphStyle(
+            'Bullet',
+            parent=styles['Normal'],
+            spaceAfter=0.1*inch
+        ),
+        'transcript': ParagraphStyle(
+            'Transcript',
+            parent=styles['Normal'],
+            spaceAfter=0.05*inch
+        ),
+        'speaker': ParagraphStyle(
+            'Speaker',
+            parent=styles['Normal'],
+            fontName='Helvetica-Bold',
+            textColor=colors.HexColor('#0066cc'),
+            spaceAfter=6,
+            spaceBefore=12
+        ),
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=colors.grey,
+            alignment=1
+        )
+    }
+
+
+def _xml_text(text: str):
+    """Build a <w:t> element that keeps leading and trailing spaces.
+
+    Args:
+        text: Text content
+
+    Returns:
+        w:t element
+    """
+    t = OxmlElement("w:t")
+    t.set(qn("xml:space"), "preserve")
+    t.text = text
+    return t
+
+
+def _xml_run(text: str, break_before: bool = False):
+    """Build a <w:r> element holding text.
+
+    Args:
+        text: Text content
+        break_before: Start the run with a line break
+
+    Returns:
+        w:r element
+    """
+    run = OxmlElement("w:r")
+    if break_before:
+        run.append(OxmlElement("w:br"))
+    run.append(_xml_text(text))
+    return run
+
+
+def _speaker_rpr():
+    """Build run properties for transcript speaker headers.
+
+    Returns:
+        w:rPr element (bold, #0066CC)
+    """
+    rpr = OxmlElement("w:rPr")
+    rpr.append(OxmlElement("w:b"))
+    color = OxmlElement("w:color")
+    color.set(qn("w:val"), "0066CC")
+    rpr.append(color)
+    return rpr
+
+
+def _insert_paragraph(body, anchor, run):
+    """Wrap a run in a <w:p> and add it to the document body.
+
+    Args:
+        body: Document body element
+        anchor: Element to insert before (the body's sectPr), or None
+        run: w:r element
+    """
+    paragraph = OxmlElement("w:p")
+    paragraph.append(run)
+
+    if anchor is not None:
+        anchor.addprevious(paragraph)
+    else:
+        body.append(paragraph)
+
+
+METADATA_LABELS = ("Title:", "Date:", "Participants:", "Agenda:")
+
+
+@lru_cache(maxsize=1)
+def _docx_skeleton() -> bytes:
+    """Render the meeting-independent start of every DOCX export once.
+
+    Returns:
+        DOCX bytes with the title, the "Meeting Information" heading and a
+        styled metadata table whose value column is empty
+    """
+    doc = Document()
+
+    # Add title
+    title = doc.add_heading("Meeting Minutes", 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    # Add metadata
+    doc.add_heading("Meeting Information", 1)
+
+    metadata_table = doc.add_table(rows=len(METADATA_LABELS), cols=2)
+    metadata_table.style = 'Light Grid Accent 1'
+
+    for row, label in zip(metadata_table.rows, METADATA_LABELS):
+        row.cells[0].text = label
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
 
 class DocumentExporter:
     """Export meeting minutes to various formats."""
 
-    def __init__(self):
-        """Initialize exporter."""
-        self.exports_dir = Config.EXPORTS_DIR
+    def __init__(self, exports_dir: Optional[Path] = None):
+        """Initialize exporter.
+
+        Args:
+            exports_dir: Directory for exported files (defaults to Config.EXPORTS_DIR)
+        """
+        self.exports_dir = exports_dir or Config.EXPORTS_DIR
         self.exports_dir.mkdir(exist_ok=True)
 
+        # Shared, read-only PDF styles
+        styles = _pdf_styles()
+        self._title_style = styles['title']
+        self._heading_style = styles['heading']
+        self._bullet_style = styles['bullet']
+        self._transcript_style = styles['transcript']
+        self._speaker_style = styles['speaker']
+        self._footer_style = styles['footer']
+
     def export(
         self,
         meeting: Meeting,
@@ -49,6 +227,64 @@ class DocumentExporter:
         else:
             raise ValueError(f"Unsupported format: {options.format}")
 
+    def export_many(
+        self,
+        meetings: List[Meeting],
+        options: ExportOptions
+    ) -> List[Path]:
+        """Export several meetings in parallel worker processes.
+
+        Rendering is CPU-bound Python, so processes rather than threads.
+
+        Args:
+            meetings: Meeting objects
+            options: Export options
+
+        Returns:
+            Paths to exported files, in input order
+        """
+        if len(meetings) <= 1:
+            return [self.export(meeting, options) for meeting in meetings]
+
+        # Ship JSON rather than pickled models; workers rebuild them
+        options_json = options.model_dump_json()
+        jobs = [meeting.model_dump_json() for meeting in meetings]
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            paths = pool.map(
+                _export_worker,
+                jobs,
+                [options_json] * len(jobs),
+                [str(self.exports_dir)] * len(jobs)
+            )
+            return [Path(path) for path in paths]
+
+    def export_bytes(
+        self,
+        meeting: Meeting,
+        options: ExportOptions
+    ) -> Tuple[str, bytes]:
+        """Render meeting in memory without writing to the exports directory.
+
+        Args:
+            meeting: Meeting object
+            options: Export options
+
+        Returns:
+            Tuple of (filename, document bytes)
+        """
+        buffer = BytesIO()
+
+        if options.format == "docx":
+            self._build_docx(meeting, options).save(buffer)
+        elif options.format == "pdf":
+            self._write_pdf(meeting, options, buffer)
+        else:
+            raise ValueError(f"Unsupported format: {options.format}")
+
+        return self._generate_filename(meeting, options.format), buffer.getvalue()
+
     def export_docx(
         self,
         meeting: Meeting,
@@ -65,34 +301,43 @@ class DocumentExporter:
         """
         logger.info(f"Exporting meeting to DOCX: {meeting.title}")
 
-        # Create document
-        doc = Document()
-
-        # Add title
-        title = doc.add_heading("Meeting Minutes", 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        doc = self._build_docx(meeting, options)
 
-        # Add metadata
-        doc.add_heading("Meeting Information", 1)
+        # Save document
+        filename = self._generate_filename(meeting, "docx")
+        filepath = self.exports_dir / filename
+        doc.save(filepath)
 
-        metadata_table = doc.add_table(rows=4, cols=2)
-        metadata_table.style = 'Light Grid Accent 1'
+        logger.info(f"DOCX exported: {filepath}")
+        return filepath
 
-        # Title
-        metadata_table.rows[0].cells[0].text = "Title:"
-        metadata_table.rows[0].cells[1].text = meeting.title
+    def _build_docx(
+        self,
+        meeting: Meeting,
+        options: ExportOptions
+    ) -> Document:
+        """Build DOCX document in memory.
 
-        # Date
-        metadata_table.rows[1].cells[0].text = "Date:"
-        metadata_table.rows[1].cells[1].text = meeting.date.strftime("%B %d, %Y %H:%M")
+        Args:
+            meeting: Meeting object
+            options: Export options
 
-        # Participants
-        metadata_table.rows[2].cells[0].text = "Participants:"
-        metadata_table.rows[2].cells[1].text = ", ".join(meeting.participants) if meeting.participants else "N/A"
+        Returns:
+            python-docx Document
+        """
+        # Start from the cached skeleton (title, headings, labelled table)
+        doc = Document(BytesIO(_docx_skeleton()))
+        metadata_table = doc.tables[0]
+
+        metadata_values = (
+            meeting.title,
+            meeting.date.strftime("%B %d, %Y %H:%M"),
+            ", ".join(meeting.participants) if meeting.participants else "N/A",
+            meeting.agenda or "N/A"
+        )
 
-        # Agenda
-        metadata_table.rows[3].cells[0].text = "Agenda:"
-        metadata_table.rows[3].cells[1].text = meeting.agenda or "N/A"
+        for row, value in zip(metadata_table.rows, metadata_values):
+            row.cells[1].text = value
 
         doc.add_paragraph()
 
@@ -119,22 +364,19 @@ class DocumentExporter:
                 action_table = doc.add_table(rows=len(meeting.minutes.action_items) + 1, cols=4)
                 action_table.style = 'Light Grid Accent 1'
 
-                # Header row
+                # Row.cells rebuilds the cell grid on each access, so read it once per row
+                rows = action_table.rows
+
+                # Header row, bolded on the run it creates
                 headers = ["Owner", "Action", "Due Date", "Status"]
-                for i, header in enumerate(headers):
-                    cell = action_table.rows[0].cells[i]
-                    cell.text = header
-                    # Make header bold
-                    for paragraph in cell.paragraphs:
-                        for run in paragraph.runs:
-                            run.font.bold = True
+                for cell, header in zip(rows[0].cells, headers):
+                    cell.paragraphs[0].add_run(header).bold = True
 
                 # Data rows
-                for i, item in enumerate(meeting.minutes.action_items, 1):
-                    action_table.rows[i].cells[0].text = item.owner
-                    action_table.rows[i].cells[1].text = item.task
-                    action_table.rows[i].cells[2].text = item.due_date or "TBD"
-                    action_table.rows[i].cells[3].text = item.status
+                for row, item in zip(rows[1:], meeting.minutes.action_items):
+                    values = (item.owner, item.task, item.due_date or "TBD", item.status)
+                    for cell, value in zip(row.cells, values):
+                        cell.text = value
 
                 doc.add_paragraph()
 
@@ -156,24 +398,7 @@ class DocumentExporter:
             doc.add_page_break()
             doc.add_heading("Meeting Transcript", 1)
 
-            current_speaker = None
-            for seg in meeting.transcript:
-                if options.include_speaker_labels and seg.speaker != current_speaker:
-                    # Add speaker header
-                    speaker_para = doc.add_paragraph()
-                    speaker_run = speaker_para.add_run(f"\n{seg.speaker}")
-                    speaker_run.bold = True
-                    speaker_run.font.color.rgb = RGBColor(0, 102, 204)
-                    current_speaker = seg.speaker
-
-                # Add transcript text
-                if options.include_timestamps:
-                    timestamp = self._format_timestamp(seg.start)
-                    text = f"[{timestamp}] {seg.text}"
-                else:
-                    text = seg.text
-
-                doc.add_paragraph(text)
+            self._append_transcript_xml(doc, self._transcript_turns(meeting, options), options)
 
         # Footer
         doc.add_page_break()
@@ -183,13 +408,7 @@ class DocumentExporter:
         footer_para.runs[0].font.size = Pt(9)
         footer_para.runs[0].font.color.rgb = RGBColor(128, 128, 128)
 
-        # Save document
-        filename = self._generate_filename(meeting, "docx")
-        filepath = self.exports_dir / filename
-        doc.save(filepath)
-
-        logger.info(f"DOCX exported: {filepath}")
-        return filepath
+        return doc
 
     def export_pdf(
         self,
@@ -210,9 +429,27 @@ class DocumentExporter:
         filename = self._generate_filename(meeting, "pdf")
         filepath = self.exports_dir / filename
 
+        self._write_pdf(meeting, options, str(filepath))
+
+        logger.info(f"PDF exported: {filepath}")
+        return filepath
+
+    def _write_pdf(
+        self,
+        meeting: Meeting,
+        options: ExportOptions,
+        target: Union[str, BinaryIO]
+    ):
+        """Build PDF document and write it to target.
+
+        Args:
+            meeting: Meeting object
+            options: Export options
+            target: File path or writable binary buffer
+        """
         # Create PDF document
         doc = SimpleDocTemplate(
-            str(filepath),
+            target,
             pagesize=letter,
             rightMargin=72,
             leftMargin=72,
@@ -223,27 +460,9 @@ class DocumentExporter:
         # Container for elements
         story = []
 
-        # Styles
-        styles = getSampleStyleSheet()
-
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Title'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a1a1a'),
-            spaceAfter=30,
-            alignment=1  # Center
-        )
-
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading1'],
-            fontSize=16,
-            textColor=colors.HexColor('#0066cc'),
-            spaceAfter=12,
-            spaceBefore=12
-        )
+        title_style = self._title_style
+        heading_style = self._heading_style
+        bullet_style = self._bullet_style
 
         # Title
         story.append(Paragraph("Meeting Minutes", title_style))
@@ -276,16 +495,14 @@ class DocumentExporter:
             if meeting.minutes.summary:
                 story.append(Paragraph("Executive Summary", heading_style))
                 for bullet in meeting.minutes.summary:
-                    story.append(Paragraph(f"• {bullet}", styles['Normal']))
-                    story.append(Spacer(1, 0.1*inch))
+                    story.append(Paragraph(f"• {bullet}", bullet_style))
                 story.append(Spacer(1, 0.2*inch))
 
             # Key Decisions
             if meeting.minutes.decisions:
                 story.append(Paragraph("Key Decisions", heading_style))
                 for decision in meeting.minutes.decisions:
-                    story.append(Paragraph(f"• {decision}", styles['Normal']))
-                    story.append(Spacer(1, 0.1*inch))
+                    story.append(Paragraph(f"• {decision}", bullet_style))
                 story.append(Spacer(1, 0.2*inch))
 
             # Action Items
@@ -320,8 +537,7 @@ class DocumentExporter:
             if meeting.minutes.risks:
                 story.append(Paragraph("Risks & Open Questions", heading_style))
                 for risk in meeting.minutes.risks:
-                    story.append(Paragraph(f"• {risk}", styles['Normal']))
-                    story.append(Spacer(1, 0.1*inch))
+                    story.append(Paragraph(f"• {risk}", bullet_style))
                 story.append(Spacer(1, 0.2*inch))
 
         # Transcript (if included)
@@ -329,46 +545,83 @@ class DocumentExporter:
             story.append(PageBreak())
             story.append(Paragraph("Meeting Transcript", heading_style))
 
-            current_speaker = None
-            for seg in meeting.transcript:
-                if options.include_speaker_labels and seg.speaker != current_speaker:
-                    speaker_style = ParagraphStyle(
-                        'Speaker',
-                        parent=styles['Normal'],
-                        fontName='Helvetica-Bold',
-                        textColor=colors.HexColor('#0066cc'),
-                        spaceAfter=6,
-                        spaceBefore=12
-                    )
-                    story.append(Paragraph(seg.speaker, speaker_style))
-                    current_speaker = seg.speaker
-
-                if options.include_timestamps:
-                    timestamp = self._format_timestamp(seg.start)
-                    text = f"[{timestamp}] {seg.text}"
-                else:
-                    text = seg.text
-
-                story.append(Paragraph(text, styles['Normal']))
-                story.append(Spacer(1, 0.05*inch))
+            for speaker, lines in self._transcript_turns(meeting, options):
+                if options.include_speaker_labels:
+                    story.append(Paragraph(escape(speaker), self._speaker_style))
+
+                # One Paragraph per turn keeps paraparser calls to the turn count;
+                # spacing comes from the style, not a Spacer per paragraph
+                text = "<br/>".join(escape(line) for line in lines)
+                story.append(Paragraph(text, self._transcript_style))
 
         # Footer
         footer_text = f"Generated by Meeting Minutes Generator on {datetime.now().strftime('%B %d, %Y %H:%M')}"
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=8,
-            textColor=colors.grey,
-            alignment=1
-        )
         story.append(Spacer(1, 0.5*inch))
-        story.append(Paragraph(footer_text, footer_style))
+        story.append(Paragraph(footer_text, self._footer_style))
 
         # Build PDF
         doc.build(story)
 
-        logger.info(f"PDF exported: {filepath}")
-        return filepath
+    def _append_transcript_xml(
+        self,
+        doc: Document,
+        turns: List[Tuple[str, List[str]]],
+        options: ExportOptions
+    ):
+        """Append transcript paragraphs as raw WordprocessingML.
+
+        Builds <w:p> elements directly instead of going through
+        add_paragraph/add_run, which dominate export time for long
+        transcripts.
+
+        Args:
+            doc: python-docx Document
+            turns: List of (speaker, lines) tuples from _transcript_turns
+            options: Export options
+        """
+        body = doc.element.body
+        # Paragraphs must stay ahead of the trailing section properties
+        anchor = body.sectPr
+
+        for speaker, lines in turns:
+            if options.include_speaker_labels:
+                # Bold blue speaker header, preceded by a line break
+                run = _xml_run(speaker, break_before=True)
+                run.insert(0, _speaker_rpr())
+                _insert_paragraph(body, anchor, run)
+
+            # One paragraph per turn, lines separated by <w:br/>
+            run = OxmlElement("w:r")
+            for i, line in enumerate(lines):
+                if i:
+                    run.append(OxmlElement("w:br"))
+                run.append(_xml_text(line))
+            _insert_paragraph(body, anchor, run)
+
+    def _transcript_turns(
+        self,
+        meeting: Meeting,
+        options: ExportOptions
+    ) -> List[Tuple[str, List[str]]]:
+        """Group consecutive transcript segments by speaker.
+
+        Args:
+            meeting: Meeting object
+            options: Export options
+
+        Returns:
+            List of (speaker, lines) tuples, one per speaker turn
+        """
+        turns = []
+
+        for speaker, segments in groupby(meeting.transcript, key=lambda seg: seg.speaker):
+            if options.include_timestamps:
+                lines = [f"[{self._format_timestamp(int(seg.start))}] {seg.text}" for seg in segments]
+            else:
+                lines = [seg.text for seg in segments]
+            turns.append((speaker, lines))
+
+        return turns
 
     def _generate_filename(self, meeting: Meeting, extension: str) -> str:
         """Generate filename for export.
@@ -381,23 +634,41 @@ class DocumentExporter:
             Filename string
         """
         # Sanitize title for filename
-        safe_title = "".join(c for c in meeting.title if c.isalnum() or c in (' ', '-', '_'))
-        safe_title = safe_title.replace(' ', '_')[:50]
+        safe_title = _UNSAFE_FILENAME_CHARS.sub("", meeting.title).replace(' ', '_')[:50]
 
         date_str = meeting.date.strftime("%Y%m%d")
         timestamp = datetime.now().strftime("%H%M%S")
 
         return f"{date_str}_{safe_title}_{timestamp}.{extension}"
 
-    def _format_timestamp(self, seconds: float) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _format_timestamp(seconds: int) -> str:
         """Format timestamp as MM:SS.
 
+        Cached per whole second, since dense transcripts repeat them.
+
         Args:
-            seconds: Time in seconds
+            seconds: Time in whole seconds
 
         Returns:
             Formatted timestamp
         """
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(seconds, 60)
         return f"{minutes:02d}:{secs:02d}"
+
+
+def _export_worker(meeting_json: str, options_json: str, exports_dir: str) -> str:
+    """Export one meeting inside a worker process.
+
+    Args:
+        meeting_json: Meeting serialized with model_dump_json
+        options_json: ExportOptions serialized with model_dump_json
+        exports_dir: Directory for exported files
+
+    Returns:
+        Path to exported file, as string
+    """
+    meeting = Meeting.model_validate_json(meeting_json)
+    options = ExportOptions.model_validate_json(options_json)
+    return str(DocumentExporter(Path(exports_dir)).export(meeting, options))
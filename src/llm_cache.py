@@ -0,0 +1,108 @@
+"""On-disk cache of generated minutes, keyed by the exact LLM prompt."""
+
+import hashlib
+import logging
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """Exact-match cache of LLM results stored in SQLite."""
+
+    def __init__(self, path: Path):
+        """Initialize cache.
+
+        Args:
+            path: Path to SQLite cache database
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(provider: str, model: str, system_prompt: str, user_prompt: str) -> str:
+        """Hash everything that determines the LLM output.
+
+        Args:
+            provider: LLM provider
+            model: Model name
+            system_prompt: System prompt
+            user_prompt: User prompt
+
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        for part in (provider, model, system_prompt, user_prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")  # Keep part boundaries unambiguous
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached response or None
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT response FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    def set(self, key: str, response: str):
+        """Store a response.
+
+        Args:
+            key: Key from make_key
+            response: Response to cache
+        """
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, datetime.now().isoformat())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def delete(self, key: str):
+        """Evict a response.
+
+        Args:
+            key: Key from make_key
+        """
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache delete failed: {e}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and is always closed.
+
+        Yields:
+            SQLite connection
+        """
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
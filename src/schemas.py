@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, field_validator
 
 
 class TranscriptSegment(BaseModel):
@@ -13,13 +13,18 @@ class TranscriptSegment(BaseModel):
     speaker: str = Field(default="Speaker 1", description="Speaker label")
     confidence: float = Field(default=1.0, ge=0.0, le=1.0, description="Confidence score")
 
-    @validator('text')
+    @field_validator('text')
+    @classmethod
     def text_not_empty(cls, v):
         if not v or not v.strip():
             raise ValueError("Text cannot be empty")
         return v.strip()
 
 
+# Validates a whole transcript in one call instead of one model at a time
+TRANSCRIPT_ADAPTER = TypeAdapter(List[TranscriptSegment])
+
+
 class ActionItem(BaseModel):
     """An action item extracted from the meeting."""
     owner: str = Field(..., description="Person responsible")
@@ -37,7 +42,8 @@ class MeetingMinutes(BaseModel):
     risks: List[str] = Field(default_factory=list, description="Risks and open questions")
     notes: Optional[str] = Field(None, description="Additional notes")
 
-    @validator('summary')
+    @field_validator('summary')
+    @classmethod
     def summary_max_length(cls, v):
         if len(v) > 8:
             return v[:8]
@@ -57,10 +63,9 @@ class Meeting(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # False for meetings listed without their transcript; saving one of
+    # those leaves the stored transcript alone unless segments were set
+    _transcript_loaded: bool = PrivateAttr(default=True)
 
 
 class ExportOptions(BaseModel):
@@ -2,21 +2,91 @@
 
 import json
 import logging
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text
+from sqlalchemy import create_engine, delete, event, func, insert, text, update, Column, Float, ForeignKey, Integer, String, DateTime, Text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import defer, sessionmaker, Session
 
 from src.config import Config
-from src.schemas import Meeting, TranscriptSegment, MeetingMinutes
+from src.schemas import ActionItem, Meeting, MeetingMinutes, TranscriptSegment, TRANSCRIPT_ADAPTER
 
 logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
+# Most meetings have no participants; skip the JSON codec for that case
+EMPTY_JSON_LIST = "[]"
+
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA mmap_size=268435456",  # Read pages through a 256 MB memory map
+)
+
+
+# Full-text index over meeting metadata, kept in sync with meetings by triggers
+FTS_SCHEMA = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS meetings_fts USING fts5(
+        title, participants, agenda, content='meetings', content_rowid='id'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS meetings_fts_ai AFTER INSERT ON meetings BEGIN
+        INSERT INTO meetings_fts(rowid, title, participants, agenda)
+        VALUES (new.id, new.title, new.participants, new.agenda);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS meetings_fts_ad AFTER DELETE ON meetings BEGIN
+        INSERT INTO meetings_fts(meetings_fts, rowid, title, participants, agenda)
+        VALUES ('delete', old.id, old.title, old.participants, old.agenda);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS meetings_fts_au AFTER UPDATE ON meetings BEGIN
+        INSERT INTO meetings_fts(meetings_fts, rowid, title, participants, agenda)
+        VALUES ('delete', old.id, old.title, old.participants, old.agenda);
+        INSERT INTO meetings_fts(rowid, title, participants, agenda)
+        VALUES (new.id, new.title, new.participants, new.agenda);
+    END""",
+)
+
+
+def _fts_query(search: str) -> str:
+    """Build an FTS5 MATCH expression that prefix-matches every search word.
+
+    Args:
+        search: Raw user search text
+
+    Returns:
+        MATCH expression, empty if the search has no words
+    """
+    # Quote each word so FTS5 operators in user input are taken literally
+    return " ".join('"{}"*'.format(word.replace('"', '""')) for word in search.split())
+
+
+def _keeps_stored_transcript(meeting: Meeting) -> bool:
+    """Check whether saving a meeting must leave its stored transcript alone.
+
+    Args:
+        meeting: Meeting object
+
+    Returns:
+        True if the meeting was listed without its transcript and no
+        segments have been assigned since
+    """
+    return not meeting._transcript_loaded and not meeting.transcript
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply connection-level PRAGMAs once per new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class MeetingDB(Base):
     """Database model for meetings."""
@@ -25,16 +95,30 @@ class MeetingDB(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String(255), nullable=False)
-    date = Column(DateTime, nullable=False)
+    date = Column(DateTime, nullable=False, index=True)  # Sort and pagination key
     participants = Column(Text)  # JSON string
     agenda = Column(Text, nullable=True)
-    transcript = Column(Text)  # JSON string
+    transcript = Column(Text)  # Legacy JSON string, superseded by transcript_segments
     minutes = Column(Text, nullable=True)  # JSON string
     audio_path = Column(String(500), nullable=True)
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
 
 
+class TranscriptSegmentDB(Base):
+    """Database model for transcript segments."""
+
+    __tablename__ = "transcript_segments"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    meeting_id = Column(Integer, ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False, index=True)
+    start = Column(Float, nullable=False)
+    end = Column(Float, nullable=False)
+    text = Column(Text, nullable=False)
+    speaker = Column(String(255), nullable=False)
+    confidence = Column(Float, nullable=False, default=1.0)
+
+
 class MeetingStorage:
     """Storage manager for meetings."""
 
@@ -44,9 +128,13 @@ class MeetingStorage:
         Args:
             db_path: Path to SQLite database
         """
+        if db_path is None:
+            Config.ensure_dirs()
+
         self.db_path = db_path or Config.STORAGE_PATH
         self.engine = None
         self.Session = None
+        self.fts_enabled = False
         self._initialize_db()
 
     def _initialize_db(self):
@@ -55,13 +143,31 @@ class MeetingStorage:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
             db_url = f"sqlite:///{self.db_path}"
-            self.engine = create_engine(db_url, echo=False)
+            self.engine = create_engine(
+                db_url,
+                echo=False,
+                connect_args={
+                    # Storage is shared across Streamlit script-runner threads
+                    "check_same_thread": False,
+                    # Keep more prepared statements per connection (default 128)
+                    "cached_statements": 256
+                }
+            )
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
 
             # Create tables
             Base.metadata.create_all(self.engine)
 
-            # Create session factory
-            self.Session = sessionmaker(bind=self.engine)
+            # create_all skips indexes on tables that already exist, so
+            # add any declared since an older database was created
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(self.engine, checkfirst=True)
+            self._initialize_fts()
+
+            # Create session factory; objects stay readable after commit
+            # without a refresh SELECT (e.g. the new id in save_meeting)
+            self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
 
             logger.info(f"Database initialized: {self.db_path}")
 
@@ -69,165 +175,262 @@ class MeetingStorage:
             logger.error(f"Failed to initialize database: {e}")
             raise
 
-    def save_meeting(self, meeting: Meeting) -> int:
+    def _initialize_fts(self):
+        """Create the meetings full-text index, if SQLite has FTS5."""
+        try:
+            with self.engine.begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE name = 'meetings_fts'")
+                ).first()
+
+                for statement in FTS_SCHEMA:
+                    conn.execute(text(statement))
+
+                # Index meetings saved before the FTS table existed
+                if not exists:
+                    conn.execute(text("INSERT INTO meetings_fts(meetings_fts) VALUES ('rebuild')"))
+
+            self.fts_enabled = True
+
+        except Exception as e:
+            logger.warning(f"FTS5 unavailable, search will use LIKE: {e}")
+
+    @contextmanager
+    def session_scope(self, session: Optional[Session] = None) -> Iterator[Session]:
+        """Provide a transactional scope around a series of operations.
+
+        Pass the yielded session to several storage methods to run them on
+        one connection and commit them together.
+
+        Args:
+            session: Session from an enclosing scope; reused as-is, leaving
+                commit and close to that scope
+
+        Yields:
+            Open session, committed on success and rolled back on error
+        """
+        if session is not None:
+            yield session
+            return
+
+        session = self.Session()
+
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def save_meeting(self, meeting: Meeting, session: Optional[Session] = None) -> int:
         """Save meeting to database.
 
         Args:
             meeting: Meeting object
+            session: Optional session from session_scope
 
         Returns:
             Meeting ID
         """
-        session: Session = self.Session()
+        # Serialize before opening the session so the write transaction
+        # (and SQLite's write lock) is held only for the actual insert
+        values = self._meeting_values(meeting)
 
         try:
-            # Convert to database model
-            db_meeting = MeetingDB(
-                title=meeting.title,
-                date=meeting.date,
-                participants=json.dumps(meeting.participants),
-                agenda=meeting.agenda,
-                transcript=json.dumps([seg.model_dump() for seg in meeting.transcript]),
-                minutes=json.dumps(meeting.minutes.model_dump()) if meeting.minutes else None,
-                audio_path=meeting.audio_path,
-                created_at=meeting.created_at,
-                updated_at=meeting.updated_at
-            )
+            with self.session_scope(session) as session:
+                meeting_id = self._write_meeting(session, values)
+                if not _keeps_stored_transcript(meeting):
+                    self._replace_segments(session, meeting_id, meeting.transcript)
 
-            if meeting.id:
-                # Update existing
-                db_meeting.id = meeting.id
-                session.merge(db_meeting)
-            else:
-                # Create new
-                session.add(db_meeting)
+        except Exception as e:
+            logger.error(f"Failed to save meeting: {e}")
+            raise
 
-            session.commit()
+        logger.info(f"Meeting saved: ID {meeting_id}")
+        return meeting_id
 
-            meeting_id = db_meeting.id
-            logger.info(f"Meeting saved: ID {meeting_id}")
+    def save_meetings(self, meetings: List[Meeting], session: Optional[Session] = None) -> List[int]:
+        """Save several meetings in a single transaction.
+
+        Args:
+            meetings: Meeting objects
+            session: Optional session from session_scope
+
+        Returns:
+            Meeting IDs in input order
+        """
+        all_values = [self._meeting_values(meeting) for meeting in meetings]
+        new_values = [values for values in all_values if not values["id"]]
+
+        try:
+            with self.session_scope(session) as session:
+                # New meetings go in as one executemany; RETURNING sorted by
+                # parameter order maps the generated ids back to the inputs
+                new_ids = iter(
+                    session.execute(
+                        insert(MeetingDB).returning(MeetingDB.id, sort_by_parameter_order=True),
+                        new_values
+                    ).scalars().all()
+                    if new_values else []
+                )
 
-            return meeting_id
+                meeting_ids = []
+                for meeting, values in zip(meetings, all_values):
+                    if values["id"]:
+                        meeting_id = self._write_meeting(session, values)
+                        if not _keeps_stored_transcript(meeting):
+                            session.execute(
+                                delete(TranscriptSegmentDB).where(TranscriptSegmentDB.meeting_id == meeting_id)
+                            )
+                    else:
+                        meeting_id = next(new_ids)
+                    meeting_ids.append(meeting_id)
+
+                # All segments of all meetings in one bulk insert
+                segment_rows = [
+                    {"meeting_id": meeting_id, **seg.model_dump()}
+                    for meeting, meeting_id in zip(meetings, meeting_ids)
+                    if not _keeps_stored_transcript(meeting)
+                    for seg in meeting.transcript
+                ]
+                if segment_rows:
+                    session.execute(insert(TranscriptSegmentDB), segment_rows)
 
         except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to save meeting: {e}")
+            logger.error(f"Failed to save meetings: {e}")
             raise
 
-        finally:
-            session.close()
+        logger.info(f"Meetings saved: {len(meeting_ids)}")
+        return meeting_ids
 
-    def get_meeting(self, meeting_id: int) -> Optional[Meeting]:
+    def get_meeting(self, meeting_id: int, session: Optional[Session] = None) -> Optional[Meeting]:
         """Get meeting by ID.
 
         Args:
             meeting_id: Meeting ID
+            session: Optional session from session_scope
 
         Returns:
             Meeting object or None
         """
-        session: Session = self.Session()
-
         try:
-            db_meeting = session.query(MeetingDB).filter_by(id=meeting_id).first()
+            with self.session_scope(session) as session:
+                db_meeting = session.query(MeetingDB).filter_by(id=meeting_id).first()
 
-            if not db_meeting:
-                return None
+                if not db_meeting:
+                    return None
 
-            # Convert to Meeting schema
-            return self._db_to_meeting(db_meeting)
+                # Convert to Meeting schema
+                return self._db_to_meeting(db_meeting, self._load_segments(session, db_meeting))
 
         except Exception as e:
             logger.error(f"Failed to get meeting: {e}")
             return None
 
-        finally:
-            session.close()
-
     def list_meetings(
         self,
         limit: int = 50,
-        offset: int = 0,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        before: Optional[Tuple[datetime, int]] = None,
+        session: Optional[Session] = None
     ) -> List[Meeting]:
-        """List meetings.
+        """List meetings, newest first.
 
         Args:
             limit: Maximum number of meetings to return
-            offset: Offset for pagination
-            search: Optional search query (searches title and participants)
+            search: Optional search query (prefix-matches words in title,
+                participants and agenda)
+            before: Optional (date, id) of the last meeting on the previous
+                page; only older meetings are returned
+            session: Optional session from session_scope
 
         Returns:
-            List of meetings
+            List of meetings, without transcripts (use get_meeting for those).
+            Saving one back keeps its stored transcript unless new segments
+            were assigned.
         """
-        session: Session = self.Session()
-
         try:
-            query = session.query(MeetingDB)
-
-            if search:
-                search_term = f"%{search}%"
-                query = query.filter(
-                    (MeetingDB.title.like(search_term)) |
-                    (MeetingDB.participants.like(search_term))
-                )
-
-            query = query.order_by(MeetingDB.date.desc())
-            query = query.limit(limit).offset(offset)
-
-            db_meetings = query.all()
-
-            return [self._db_to_meeting(db_meeting) for db_meeting in db_meetings]
+            with self.session_scope(session) as session:
+                # Leave the legacy transcript blob out of the row fetch
+                query = session.query(MeetingDB).options(defer(MeetingDB.transcript))
+
+                match = _fts_query(search) if search and self.fts_enabled else ""
+
+                if match:
+                    query = query.filter(
+                        text("meetings.id IN (SELECT rowid FROM meetings_fts WHERE meetings_fts MATCH :match)")
+                    ).params(match=match)
+                elif search:
+                    search_term = f"%{search}%"
+                    query = query.filter(
+                        (MeetingDB.title.like(search_term)) |
+                        (MeetingDB.participants.like(search_term))
+                    )
+
+                # Keyset pagination: seek past the previous page instead of
+                # scanning and discarding OFFSET rows. id breaks date ties.
+                if before:
+                    before_date, before_id = before
+                    query = query.filter(
+                        (MeetingDB.date < before_date) |
+                        ((MeetingDB.date == before_date) & (MeetingDB.id < before_id))
+                    )
+
+                query = query.order_by(MeetingDB.date.desc(), MeetingDB.id.desc())
+                query = query.limit(limit)
+
+                db_meetings = query.all()
+
+                meetings = [self._db_to_meeting(db_meeting) for db_meeting in db_meetings]
+                for meeting in meetings:
+                    meeting._transcript_loaded = False
+                return meetings
 
         except Exception as e:
             logger.error(f"Failed to list meetings: {e}")
             return []
 
-        finally:
-            session.close()
-
-    def delete_meeting(self, meeting_id: int) -> bool:
+    def delete_meeting(self, meeting_id: int, session: Optional[Session] = None) -> bool:
         """Delete meeting.
 
         Args:
             meeting_id: Meeting ID
+            session: Optional session from session_scope
 
         Returns:
             True if deleted, False otherwise
         """
-        session: Session = self.Session()
-
         try:
-            db_meeting = session.query(MeetingDB).filter_by(id=meeting_id).first()
-
-            if not db_meeting:
-                return False
+            with self.session_scope(session) as session:
+                db_meeting = session.query(MeetingDB).filter_by(id=meeting_id).first()
 
-            # Delete audio file if exists
-            if db_meeting.audio_path:
-                audio_path = Path(db_meeting.audio_path)
-                if audio_path.exists():
-                    audio_path.unlink()
+                if not db_meeting:
+                    return False
 
-            session.delete(db_meeting)
-            session.commit()
+                # Delete audio file if exists
+                if db_meeting.audio_path:
+                    audio_path = Path(db_meeting.audio_path)
+                    if audio_path.exists():
+                        audio_path.unlink()
 
-            logger.info(f"Meeting deleted: ID {meeting_id}")
-            return True
+                session.execute(delete(TranscriptSegmentDB).where(TranscriptSegmentDB.meeting_id == meeting_id))
+                session.delete(db_meeting)
 
         except Exception as e:
-            session.rollback()
             logger.error(f"Failed to delete meeting: {e}")
             return False
 
-        finally:
-            session.close()
+        logger.info(f"Meeting deleted: ID {meeting_id}")
+        return True
 
-    def update_meeting(self, meeting: Meeting) -> bool:
+    def update_meeting(self, meeting: Meeting, session: Optional[Session] = None) -> bool:
         """Update existing meeting.
 
         Args:
             meeting: Meeting object with id
+            session: Optional session from session_scope
 
         Returns:
             True if updated, False otherwise
@@ -237,71 +440,194 @@ class MeetingStorage:
             return False
 
         try:
-            self.save_meeting(meeting)
+            self.save_meeting(meeting, session=session)
             return True
         except Exception as e:
             logger.error(f"Failed to update meeting: {e}")
             return False
 
-    def _db_to_meeting(self, db_meeting: MeetingDB) -> Meeting:
+    def _meeting_values(self, meeting: Meeting) -> dict:
+        """Convert Meeting schema to meetings column values.
+
+        Args:
+            meeting: Meeting object
+
+        Returns:
+            Dictionary of column values
+        """
+        values = {
+            "id": meeting.id,
+            "title": meeting.title,
+            "date": meeting.date,
+            "participants": json.dumps(meeting.participants) if meeting.participants else EMPTY_JSON_LIST,
+            "agenda": meeting.agenda,
+            # Segments live in transcript_segments; clear any legacy blob
+            "transcript": None,
+            "minutes": meeting.minutes.model_dump_json() if meeting.minutes else None,
+            "audio_path": meeting.audio_path,
+            "created_at": meeting.created_at,
+            "updated_at": meeting.updated_at
+        }
+
+        if _keeps_stored_transcript(meeting):
+            # Listed without its transcript: leave any legacy blob in place
+            del values["transcript"]
+        return values
+
+    def _write_meeting(self, session: Session, values: dict) -> int:
+        """Insert or update a meeting row without loading it first.
+
+        Args:
+            session: Open session
+            values: Column values from _meeting_values
+
+        Returns:
+            Meeting ID
+        """
+        meeting_id = values["id"]
+
+        if meeting_id:
+            # Direct UPDATE; unlike session.merge this skips the SELECT
+            # of the existing row
+            result = session.execute(
+                update(MeetingDB).where(MeetingDB.id == meeting_id).values(**values)
+            )
+            if result.rowcount:
+                return meeting_id
+
+        # New meeting, or an id that is no longer in the database
+        result = session.execute(insert(MeetingDB).values(**values))
+        return result.inserted_primary_key[0]
+
+    def _replace_segments(self, session: Session, meeting_id: int, transcript: List[TranscriptSegment]):
+        """Replace a meeting's transcript segments with one bulk insert.
+
+        Args:
+            session: Open session
+            meeting_id: Meeting ID
+            transcript: Transcript segments in order
+        """
+        session.execute(delete(TranscriptSegmentDB).where(TranscriptSegmentDB.meeting_id == meeting_id))
+
+        if transcript:
+            session.execute(
+                insert(TranscriptSegmentDB),
+                [{"meeting_id": meeting_id, **seg.model_dump()} for seg in transcript]
+            )
+
+    def _load_segments(self, session: Session, db_meeting: MeetingDB) -> List[TranscriptSegment]:
+        """Load a meeting's transcript, falling back to the legacy JSON column.
+
+        Args:
+            session: Open session
+            db_meeting: Database model
+
+        Returns:
+            Transcript segments in order
+        """
+        # Plain column tuples skip ORM instance and identity-map bookkeeping
+        rows = (
+            session.query(
+                TranscriptSegmentDB.start,
+                TranscriptSegmentDB.end,
+                TranscriptSegmentDB.text,
+                TranscriptSegmentDB.speaker,
+                TranscriptSegmentDB.confidence
+            )
+            .filter_by(meeting_id=db_meeting.id)
+            .order_by(TranscriptSegmentDB.id)
+            .all()
+        )
+
+        if rows:
+            # Rows were validated on save, so skip validation on the way out
+            return [
+                TranscriptSegment.model_construct(
+                    start=start,
+                    end=end,
+                    text=seg_text,
+                    speaker=speaker,
+                    confidence=confidence
+                )
+                for start, end, seg_text, speaker, confidence in rows
+            ]
+
+        # Meetings saved before transcript_segments existed
+        if db_meeting.transcript:
+            return TRANSCRIPT_ADAPTER.validate_json(db_meeting.transcript)
+
+        return []
+
+    def _db_to_meeting(
+        self,
+        db_meeting: MeetingDB,
+        transcript: Optional[List[TranscriptSegment]] = None
+    ) -> Meeting:
         """Convert database model to Meeting schema.
 
         Args:
             db_meeting: Database model
+            transcript: Loaded transcript segments, empty if not given
 
         Returns:
             Meeting object
         """
-        # Parse transcript
-        transcript_data = json.loads(db_meeting.transcript) if db_meeting.transcript else []
-        transcript = [TranscriptSegment(**seg) for seg in transcript_data]
+        # Everything below was validated on save, so build models without
+        # running validators again
 
         # Parse minutes
         minutes = None
         if db_meeting.minutes:
             minutes_data = json.loads(db_meeting.minutes)
-            minutes = MeetingMinutes(**minutes_data)
+            minutes_data["action_items"] = [
+                ActionItem.model_construct(**item) for item in minutes_data.get("action_items", [])
+            ]
+            minutes = MeetingMinutes.model_construct(**minutes_data)
 
         # Parse participants
-        participants = json.loads(db_meeting.participants) if db_meeting.participants else []
+        participants = (
+            json.loads(db_meeting.participants)
+            if db_meeting.participants and db_meeting.participants != EMPTY_JSON_LIST
+            else []
+        )
 
-        return Meeting(
+        return Meeting.model_construct(
             id=db_meeting.id,
             title=db_meeting.title,
             date=db_meeting.date,
             participants=participants,
             agenda=db_meeting.agenda,
-            transcript=transcript,
+            transcript=transcript or [],
             minutes=minutes,
             audio_path=db_meeting.audio_path,
             created_at=db_meeting.created_at,
             updated_at=db_meeting.updated_at
         )
 
-    def get_statistics(self) -> dict:
+    def get_statistics(self, session: Optional[Session] = None) -> dict:
         """Get database statistics.
 
+        Args:
+            session: Optional session from session_scope
+
         Returns:
             Dictionary with statistics
         """
-        session: Session = self.Session()
-
         try:
-            total_meetings = session.query(MeetingDB).count()
-
-            recent_meeting = session.query(MeetingDB)\
-                .order_by(MeetingDB.date.desc())\
-                .first()
+            with self.session_scope(session) as session:
+                # Aggregate in SQLite instead of loading full rows (and their
+                # transcript JSON) into Python
+                total_meetings, most_recent_date = session.query(
+                    func.count(MeetingDB.id),
+                    func.max(MeetingDB.date)
+                ).one()
 
             return {
                 "total_meetings": total_meetings,
-                "most_recent_date": recent_meeting.date if recent_meeting else None,
+                "most_recent_date": most_recent_date,
                 "database_path": str(self.db_path)
             }
 
         except Exception as e:
             logger.error(f"Failed to get statistics: {e}")
             return {}
-
-        finally:
-            session.close()
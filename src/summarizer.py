@@ -1,14 +1,28 @@
 """LLM-based meeting summarization and action item extraction."""
 
-import json
 import logging
-from typing import List, Optional
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import attrgetter
+from typing import Callable, List, Optional
+
+from pydantic import ValidationError
+from pydantic_core import from_json, to_json
 
 from src.config import Config
-from src.schemas import TranscriptSegment, MeetingMinutes, ActionItem
+from src.llm_cache import LLMCache
+from src.schemas import TranscriptSegment, MeetingMinutes
 
 logger = logging.getLogger(__name__)
 
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_FILLER_STRIP_RE = re.compile(Config.filler_pattern(stretched=True) + r"[,. ]*", re.IGNORECASE)
+
+# Segments scored below this by the transcriber (e.g. [inaudible]) are dropped
+MIN_COMPRESSED_CONFIDENCE = 0.6
+
 
 class MeetingSummarizer:
     """Generate meeting minutes from transcript using LLM."""
@@ -38,6 +52,26 @@ Guidelines:
 - Be concise and professional
 - If a section has no content, return an empty list"""
 
+    # Anthropic only caches a prefix once it reaches the model's minimum
+    # cacheable length (1024 tokens for Sonnet), so the marker is a no-op
+    # until the system prompt grows past that; OpenAI caches long stable
+    # prefixes automatically
+    ANTHROPIC_SYSTEM = [
+        {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+    ]
+    ANTHROPIC_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+    OPENAI_MESSAGES_PREFIX = ({"role": "system", "content": SYSTEM_PROMPT},)
+
+    # Characters of new output between partial parses while streaming
+    PARTIAL_PARSE_INTERVAL = 512
+
+    # Transcripts estimated above MAX_SINGLE_CALL_TOKENS are summarized in
+    # CHUNK_TOKENS pieces in parallel, then merged with one more call
+    MAX_SINGLE_CALL_TOKENS = 12000
+    CHUNK_TOKENS = 8000
+    CHARS_PER_TOKEN = 4  # Rough average for English text
+    CHUNK_WORKERS = 4
+
     def __init__(self, provider: str = None, model: str = None, api_key: str = None):
         """Initialize summarizer.
 
@@ -50,6 +84,14 @@ Guidelines:
         self.model = model or Config.LLM_MODEL
         self.api_key = api_key or self._get_api_key()
         self.client = None
+        self.cache = None
+        if Config.LLM_CACHE_ENABLED:
+            try:
+                self.cache = LLMCache(Config.LLM_CACHE_PATH)
+            except (sqlite3.Error, OSError) as e:
+                # Summarize without the cache rather than not at all
+                logger.warning(f"LLM cache unavailable, continuing without it: {e}")
+        self._request = self._build_request()
         self._initialize_client()
 
     def _get_api_key(self) -> Optional[str]:
@@ -60,6 +102,27 @@ Guidelines:
             return Config.ANTHROPIC_API_KEY
         return None
 
+    def _build_request(self) -> dict:
+        """Build the completion arguments that are the same for every call.
+
+        Returns:
+            Keyword arguments for the provider's create call, minus messages
+        """
+        if self.provider == "openai":
+            return {
+                "model": self.model,
+                "temperature": 0.3,
+                "response_format": {"type": "json_object"}
+            }
+        elif self.provider == "anthropic":
+            return {
+                "model": self.model,
+                "max_tokens": 4096,
+                "system": self.ANTHROPIC_SYSTEM,
+                "temperature": 0.3
+            }
+        return {}
+
     def _initialize_client(self):
         """Initialize LLM client based on provider."""
         if Config.PRIVACY_MODE and self.provider in ["openai", "anthropic"]:
@@ -74,7 +137,7 @@ Guidelines:
 
             elif self.provider == "anthropic":
                 from anthropic import Anthropic
-                self.client = Anthropic(api_key=self.api_key)
+                self.client = Anthropic(api_key=self.api_key, default_headers=self.ANTHROPIC_HEADERS)
                 logger.info(f"Initialized Anthropic client with model: {self.model}")
 
             else:
@@ -88,13 +151,16 @@ Guidelines:
     def summarize(
         self,
         transcript_segments: List[TranscriptSegment],
-        meeting_context: Optional[str] = None
+        meeting_context: Optional[str] = None,
+        on_partial: Optional[Callable[[dict], None]] = None
     ) -> MeetingMinutes:
         """Generate meeting minutes from transcript.
 
         Args:
             transcript_segments: List of transcript segments
             meeting_context: Optional context about the meeting
+            on_partial: Optional callback; when given the response is streamed
+                and the callback receives the partially parsed JSON as it grows
 
         Returns:
             MeetingMinutes object
@@ -104,6 +170,8 @@ Guidelines:
             return MeetingMinutes()
 
         # Format transcript for LLM
+        if Config.AGGRESSIVE_COMPRESSION:
+            transcript_segments = self._coalesce(transcript_segments)
         transcript_text = self._format_transcript(transcript_segments)
 
         # Build user prompt
@@ -114,13 +182,34 @@ Guidelines:
         if meeting_context:
             user_prompt = f"Meeting Context: {meeting_context}\n\n{user_prompt}"
 
+        cache_key = None
+        if self.cache:
+            cache_key = LLMCache.make_key(self.provider, self.model, self.SYSTEM_PROMPT, user_prompt)
+            cached = self.cache.get(cache_key)
+            if cached:
+                try:
+                    minutes = MeetingMinutes.model_validate_json(cached)
+                    logger.info("Meeting minutes served from LLM cache")
+                    return minutes
+                except ValidationError as e:
+                    # Corrupt or written under an older schema; treat as a miss
+                    logger.warning(f"Discarding unreadable LLM cache entry: {e}")
+                    self.cache.delete(cache_key)
+
         try:
             # Get completion from LLM
-            response = self._get_completion(user_prompt)
+            if len(user_prompt) // self.CHARS_PER_TOKEN > self.MAX_SINGLE_CALL_TOKENS:
+                response = self._summarize_chunks(transcript_segments, meeting_context, on_partial)
+            else:
+                response = self._get_completion(user_prompt, on_partial)
 
             # Parse and validate response
             minutes = self._parse_response(response)
 
+            # Empty minutes usually mean a failed parse; don't pin that result
+            if cache_key and (minutes.summary or minutes.decisions or minutes.action_items or minutes.risks):
+                self.cache.set(cache_key, minutes.model_dump_json())
+
             logger.info("Meeting minutes generated successfully")
             return minutes
 
@@ -128,6 +217,122 @@ Guidelines:
             logger.error(f"Summarization failed: {e}")
             return MeetingMinutes()
 
+    def _summarize_chunks(
+        self,
+        segments: List[TranscriptSegment],
+        meeting_context: Optional[str] = None,
+        on_partial: Optional[Callable[[dict], None]] = None
+    ) -> str:
+        """Summarize a long transcript chunk by chunk, then merge the results.
+
+        Args:
+            segments: Transcript segments
+            meeting_context: Optional context about the meeting
+            on_partial: Optional callback, used for the final merge call
+
+        Returns:
+            LLM response text with the merged minutes
+        """
+        chunks = self._chunk_segments(segments)
+        context = f"Meeting Context: {meeting_context}\n\n" if meeting_context else ""
+        prompts = [
+            f"{context}Meeting Transcript (part {i} of {len(chunks)}):\n\n{self._format_transcript(chunk)}"
+            for i, chunk in enumerate(chunks, 1)
+        ]
+        logger.info(f"Long transcript, summarizing {len(chunks)} chunks")
+
+        with ThreadPoolExecutor(max_workers=min(self.CHUNK_WORKERS, len(prompts))) as pool:
+            partials = [self._parse_response(response) for response in pool.map(self._get_completion, prompts)]
+
+        merged = self._merge_partials(partials)
+        merge_prompt = (
+            f"{context}Partial minutes from consecutive parts of one meeting:\n\n"
+            f"{to_json(merged).decode()}\n\n"
+            "Merge these partial minutes into the final minutes JSON."
+        )
+
+        try:
+            return self._get_completion(merge_prompt, on_partial)
+        except Exception as e:
+            logger.warning(f"Merging chunk minutes failed, using concatenated minutes: {e}")
+            return to_json(merged).decode()
+
+    def _chunk_segments(self, segments: List[TranscriptSegment]) -> List[List[TranscriptSegment]]:
+        """Split segments into chunks of roughly CHUNK_TOKENS tokens each.
+
+        Args:
+            segments: Transcript segments
+
+        Returns:
+            Consecutive runs of segments; a segment is never split
+        """
+        budget = self.CHUNK_TOKENS * self.CHARS_PER_TOKEN
+        chunks = []
+        current = []
+        size = 0
+
+        for seg in segments:
+            if current and size + len(seg.text) > budget:
+                chunks.append(current)
+                current = []
+                size = 0
+            current.append(seg)
+            size += len(seg.text) + 3  # Indent and newline
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _merge_partials(self, partials: List[MeetingMinutes]) -> dict:
+        """Concatenate per-chunk minutes, dropping repeated entries.
+
+        A plain dict rather than MeetingMinutes, which would cut the summary
+        to 8 bullets before the merge call has chosen them.
+
+        Args:
+            partials: Minutes for each chunk, in order
+
+        Returns:
+            Merged minutes as a JSON-ready dict
+        """
+        action_items = {}
+        for minutes in partials:
+            for item in minutes.action_items:
+                action_items.setdefault((item.owner.lower(), item.task.lower()), item.model_dump())
+
+        return {
+            "summary": list(dict.fromkeys(b for minutes in partials for b in minutes.summary)),
+            "decisions": list(dict.fromkeys(d for minutes in partials for d in minutes.decisions)),
+            "action_items": list(action_items.values()),
+            "risks": list(dict.fromkeys(r for minutes in partials for r in minutes.risks))
+        }
+
+    def _coalesce(self, segments: List[TranscriptSegment]) -> List[TranscriptSegment]:
+        """Merge consecutive same-speaker segments and strip filler words.
+
+        Args:
+            segments: Transcript segments
+
+        Returns:
+            One segment per speaker turn, starting at the turn's first segment
+        """
+        kept = [seg for seg in segments if seg.confidence >= MIN_COMPRESSED_CONFIDENCE]
+        turns = []
+
+        for speaker, turn in groupby(kept, key=attrgetter("speaker")):
+            turn = list(turn)
+            text = _FILLER_STRIP_RE.sub("", " ".join(seg.text for seg in turn)).strip()
+            if text:
+                turns.append(TranscriptSegment.model_construct(
+                    start=turn[0].start,
+                    end=turn[-1].end,
+                    text=text,
+                    speaker=speaker,
+                    confidence=min(seg.confidence for seg in turn)
+                ))
+
+        return turns
+
     def _format_transcript(self, segments: List[TranscriptSegment]) -> str:
         """Format transcript segments for LLM processing.
 
@@ -138,17 +343,14 @@ Guidelines:
             Formatted transcript string
         """
         lines = []
-        current_speaker = None
 
-        for seg in segments:
-            timestamp = self._format_timestamp(seg.start)
-
-            # Group consecutive segments from same speaker
-            if seg.speaker != current_speaker:
-                lines.append(f"\n[{timestamp}] {seg.speaker}:")
-                current_speaker = seg.speaker
-
-            lines.append(f"  {seg.text}")
+        # Group consecutive segments from same speaker; only the first
+        # segment of each turn needs a timestamp
+        for speaker, turn in groupby(segments, key=attrgetter("speaker")):
+            first = next(turn)
+            lines.append(f"\n[{self._format_timestamp(first.start)}] {speaker}:")
+            lines.append(f"  {first.text}")
+            lines.extend([f"  {seg.text}" for seg in turn])
 
         return "\n".join(lines)
 
@@ -161,46 +363,91 @@ Guidelines:
         Returns:
             Formatted timestamp
         """
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
         return f"{minutes:02d}:{secs:02d}"
 
-    def _get_completion(self, prompt: str) -> str:
+    def _get_completion(
+        self,
+        prompt: str,
+        on_partial: Optional[Callable[[dict], None]] = None
+    ) -> str:
         """Get completion from LLM.
 
         Args:
             prompt: User prompt
+            on_partial: Optional callback for partial results; enables streaming
 
         Returns:
             LLM response text
         """
         if self.provider == "openai":
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
+            request = dict(
+                self._request,
+                messages=[*self.OPENAI_MESSAGES_PREFIX, {"role": "user", "content": prompt}]
             )
+
+            if on_partial:
+                stream = self.client.chat.completions.create(**request, stream=True)
+                return self._collect_stream(
+                    (chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices),
+                    on_partial
+                )
+
+            response = self.client.chat.completions.create(**request)
             return response.choices[0].message.content
 
         elif self.provider == "anthropic":
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                system=self.SYSTEM_PROMPT,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3
+            request = dict(self._request, messages=[{"role": "user", "content": prompt}])
+
+            if on_partial:
+                with self.client.messages.stream(**request) as stream:
+                    text = self._collect_stream(stream.text_stream, on_partial)
+                    response = stream.get_final_message()
+            else:
+                response = self.client.messages.create(**request)
+                text = response.content[0].text
+
+            usage = response.usage
+            logger.info(
+                "Anthropic prompt cache: "
+                f"read={getattr(usage, 'cache_read_input_tokens', None)}, "
+                f"created={getattr(usage, 'cache_creation_input_tokens', None)}"
             )
-            return response.content[0].text
+
+            return text
 
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
 
+    def _collect_stream(self, chunks, on_partial: Callable[[dict], None]) -> str:
+        """Accumulate streamed text, reporting partial JSON along the way.
+
+        Args:
+            chunks: Iterable of response text fragments
+            on_partial: Callback receiving the partially parsed response
+
+        Returns:
+            Full response text
+        """
+        parts = []
+        pending = 0
+
+        for text in chunks:
+            parts.append(text)
+            pending += len(text)
+
+            if pending >= self.PARTIAL_PARSE_INTERVAL:
+                pending = 0
+                try:
+                    data = from_json("".join(parts), allow_partial=True)
+                except ValueError:
+                    # Not JSON yet (e.g. a markdown preamble); try again later
+                    continue
+                if isinstance(data, dict):
+                    on_partial(data)
+
+        return "".join(parts)
+
     def _parse_response(self, response: str) -> MeetingMinutes:
         """Parse LLM response into MeetingMinutes.
 
@@ -211,32 +458,23 @@ Guidelines:
             MeetingMinutes object
         """
         try:
-            # Parse JSON response
-            data = json.loads(response)
-
-            # Validate and convert to schema
-            action_items = [
-                ActionItem(**item) for item in data.get("action_items", [])
-            ]
-
-            minutes = MeetingMinutes(
-                summary=data.get("summary", []),
-                decisions=data.get("decisions", []),
-                action_items=action_items,
-                risks=data.get("risks", []),
-                notes=data.get("notes")
-            )
+            # Parse and validate in a single pass in pydantic-core
+            minutes = MeetingMinutes.model_validate_json(response)
+        except ValidationError as e:
+            if e.errors()[0]["type"] != "json_invalid":
+                logger.error(f"Failed to parse response: {e}")
+                return MeetingMinutes()
+
+            logger.error(f"Failed to parse JSON response: {e}")
+            # Try to extract JSON from markdown code blocks
+            return self._extract_json_from_markdown(response)
 
+        try:
             # Validate schema
             self._validate_minutes(minutes)
 
             return minutes
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            # Try to extract JSON from markdown code blocks
-            return self._extract_json_from_markdown(response)
-
         except Exception as e:
             logger.error(f"Failed to parse response: {e}")
             return MeetingMinutes()
@@ -252,29 +490,18 @@ Guidelines:
         """
         try:
             # Look for JSON in code blocks
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
+            match = _JSON_FENCE.search(response)
+            if match:
+                json_str = match.group(1)
             else:
-                json_str = response
+                # Unfenced text around the JSON, or output cut off before the
+                # closing fence: parse from the first brace
+                json_str = response[response.find("{"):] if "{" in response else response
 
-            data = json.loads(json_str)
+            # Partial parsing salvages responses truncated by max_tokens
+            data = from_json(json_str, allow_partial=True)
 
-            action_items = [
-                ActionItem(**item) for item in data.get("action_items", [])
-            ]
-
-            return MeetingMinutes(
-                summary=data.get("summary", []),
-                decisions=data.get("decisions", []),
-                action_items=action_items,
-                risks=data.get("risks", [])
-            )
+            return MeetingMinutes.model_validate(data)
 
         except Exception as e:
             logger.error(f"Failed to extract JSON from markdown: {e}")
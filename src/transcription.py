@@ -1,18 +1,113 @@
 """Audio transcription using Whisper."""
 
 import logging
+import os
+import re
 import warnings
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 from typing import List, Optional, Tuple
-import torch
 
 warnings.filterwarnings("ignore", category=FutureWarning)
 
+import numpy as np
+
+from src.audio import SAMPLE_RATE, detect_speech, load_audio
 from src.config import Config
 from src.schemas import TranscriptSegment
 
 logger = logging.getLogger(__name__)
 
+_BRACKET_RE = re.compile(r"[\[\]]")
+_FILLER_RE = re.compile(Config.filler_pattern(), re.IGNORECASE)
+
+
+def _decoded_audio_or_path(audio_path: Path):
+    """Get decoded samples for the backend, falling back to the file path.
+
+    Args:
+        audio_path: Path to audio file
+
+    Returns:
+        Audio samples, or the path as string if decoding failed
+    """
+    try:
+        return load_audio(audio_path)
+    except Exception as e:
+        logger.warning(f"Could not pre-decode audio, passing path to backend: {e}")
+        return str(audio_path)
+
+
+def _to_original_time(segments: List[TranscriptSegment], regions: List[Tuple[int, int]]):
+    """Map segment times from concatenated speech back to the original audio.
+
+    Args:
+        segments: Segments timed against the concatenated speech regions
+        regions: (start, end) sample offsets of the regions in the original audio
+    """
+    # Sample offset at which each region starts in the concatenated audio
+    offsets = list(accumulate((end - start for start, end in regions[:-1]), initial=0))
+
+    def original(seconds: float, bisect) -> float:
+        sample = seconds * SAMPLE_RATE
+        i = max(bisect(offsets, sample) - 1, 0)
+        start, end = regions[i]
+        return min(start + sample - offsets[i], end) / SAMPLE_RATE
+
+    for seg in segments:
+        # A segment ending exactly on a region boundary belongs to the
+        # earlier region, not the start of the next one
+        seg.start = original(seg.start, bisect_right)
+        seg.end = original(seg.end, bisect_left)
+
+
+@lru_cache(maxsize=2)
+def _load_whisper_model(model_name: str, device: str):
+    """Load an openai-whisper model once per name and device.
+
+    Args:
+        model_name: Whisper model name
+        device: Device to load the model on
+
+    Returns:
+        whisper.Whisper model
+    """
+    import whisper
+    logger.info(f"Loading Whisper model: {model_name}")
+    model = whisper.load_model(model_name, device=device)
+    logger.info("Model loaded successfully")
+    return model
+
+
+@lru_cache(maxsize=2)
+def _load_faster_whisper_model(model_name: str, device: str):
+    """Load a faster-whisper model once per name and device.
+
+    Args:
+        model_name: Whisper model name
+        device: Device to load the model on
+
+    Returns:
+        faster_whisper.WhisperModel
+    """
+    from faster_whisper import WhisperModel
+    logger.info(f"Loading faster-whisper model: {model_name}")
+
+    # int8 weights everywhere; on GPU the matmuls still run in float16
+    compute_type = Config.WHISPER_COMPUTE_TYPE or ("int8" if device == "cpu" else "int8_float16")
+
+    model = WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        # One transcription at a time per model, so let it use every core
+        cpu_threads=os.cpu_count() or 0
+    )
+    logger.info("Faster-whisper model loaded")
+    return model
+
 
 class AudioTranscriber:
     """Transcribe audio files using Whisper."""
@@ -25,17 +120,14 @@ class AudioTranscriber:
             device: Device to use (cpu, cuda)
         """
         self.model_name = model_name or Config.WHISPER_MODEL
-        self.device = device or Config.WHISPER_DEVICE
+        self.device = Config.resolve_device(device or Config.WHISPER_DEVICE)
         self.model = None
         self._load_model()
 
     def _load_model(self):
         """Load Whisper model."""
         try:
-            import whisper
-            logger.info(f"Loading Whisper model: {self.model_name}")
-            self.model = whisper.load_model(self.model_name, device=self.device)
-            logger.info("Model loaded successfully")
+            self.model = _load_whisper_model(self.model_name, self.device)
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
             raise
@@ -44,7 +136,8 @@ class AudioTranscriber:
         self,
         audio_path: str | Path,
         language: str = "en",
-        initial_prompt: Optional[str] = None
+        initial_prompt: Optional[str] = None,
+        word_timestamps: bool = False
     ) -> Tuple[List[TranscriptSegment], dict]:
         """Transcribe audio file.
 
@@ -52,6 +145,7 @@ class AudioTranscriber:
             audio_path: Path to audio file
             language: Language code (e.g., 'en')
             initial_prompt: Optional prompt to guide transcription
+            word_timestamps: Also align individual words (slower)
 
         Returns:
             Tuple of (segments, metadata)
@@ -63,33 +157,13 @@ class AudioTranscriber:
         logger.info(f"Transcribing: {audio_path.name}")
 
         try:
-            # Transcribe with word-level timestamps
-            result = self.model.transcribe(
-                str(audio_path),
-                language=language,
-                initial_prompt=initial_prompt,
-                word_timestamps=True,
-                verbose=False
+            segments, metadata = self._transcribe_audio(
+                _decoded_audio_or_path(audio_path),
+                language,
+                initial_prompt,
+                word_timestamps
             )
 
-            # Convert to transcript segments
-            segments = []
-            for seg in result.get("segments", []):
-                segment = TranscriptSegment(
-                    start=seg["start"],
-                    end=seg["end"],
-                    text=seg["text"].strip(),
-                    speaker="Speaker 1",  # Will be updated by diarization
-                    confidence=self._calculate_confidence(seg)
-                )
-                segments.append(segment)
-
-            metadata = {
-                "language": result.get("language", language),
-                "duration": result.get("segments", [{}])[-1].get("end", 0) if result.get("segments") else 0,
-                "model": self.model_name
-            }
-
             logger.info(f"Transcription complete: {len(segments)} segments")
             return segments, metadata
 
@@ -97,6 +171,77 @@ class AudioTranscriber:
             logger.error(f"Transcription failed: {e}")
             raise
 
+    def _transcribe_audio(
+        self,
+        audio,
+        language: str,
+        initial_prompt: Optional[str] = None,
+        word_timestamps: bool = False
+    ) -> Tuple[List[TranscriptSegment], dict]:
+        """Run Whisper on decoded samples (or a path) and convert the result.
+
+        Args:
+            audio: Audio samples, or the path as string
+            language: Language code
+            initial_prompt: Optional prompt to guide transcription
+            word_timestamps: Also align individual words
+
+        Returns:
+            Tuple of (segments, metadata)
+        """
+        result = self.model.transcribe(
+            self._model_input(audio),
+            language=language,
+            initial_prompt=initial_prompt,
+            word_timestamps=word_timestamps,
+            fp16=self.device == "cuda",
+            verbose=False
+        )
+
+        # Convert to transcript segments. Whisper's values already have
+        # the right types, so skip validation and only drop the empty
+        # segments the validator would reject
+        segments = [
+            TranscriptSegment.model_construct(
+                start=seg["start"],
+                end=seg["end"],
+                text=text,
+                speaker="Speaker 1",  # Will be updated by diarization
+                confidence=self._calculate_confidence(seg)
+            )
+            for seg in result.get("segments", [])
+            if (text := seg["text"].strip())
+        ]
+
+        metadata = {
+            "language": result.get("language", language),
+            "duration": result.get("segments", [{}])[-1].get("end", 0) if result.get("segments") else 0,
+            "model": self.model_name
+        }
+        return segments, metadata
+
+    def _model_input(self, audio):
+        """Get audio for the model, uploaded to the GPU when running on one.
+
+        Whisper computes the mel spectrogram on the device of the audio it is
+        given, so uploading the samples once lets the STFT run on the GPU and
+        avoids a host-to-device copy for every 30 second window.
+
+        Args:
+            audio: Audio samples, or the path as string
+
+        Returns:
+            Audio samples (numpy array or CUDA tensor), or the path as string
+        """
+        if self.device != "cuda" or isinstance(audio, str):
+            return audio
+
+        import torch
+        # Stage through pinned memory so the upload is asynchronous
+        pinned = torch.empty(audio.shape, dtype=torch.float32, pin_memory=True)
+        pinned.numpy()[:] = audio
+        return pinned.to(self.device, non_blocking=True)
+
     def _calculate_confidence(self, segment: dict) -> float:
         """Calculate confidence score for a segment.
 
@@ -116,12 +261,11 @@ class AudioTranscriber:
             return 0.6
         if duration < 0.5:
             return 0.7
-        if "[" in text or "]" in text:  # Often indicates uncertainty
+        if _BRACKET_RE.search(text):  # Often indicates uncertainty
             return 0.5
 
         # Check for common filler words
-        fillers = ["um", "uh", "er", "ah"]
-        if any(filler in text.lower() for filler in fillers):
+        if _FILLER_RE.search(text):
             return 0.8
 
         return 0.95
@@ -140,9 +284,36 @@ class AudioTranscriber:
         Returns:
             Tuple of (segments, metadata)
         """
-        # For now, use standard transcription
-        # TODO: Implement VAD preprocessing with webrtcvad
-        return self.transcribe(audio_path, language)
+        audio_path = Path(audio_path)
+        if not audio_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        try:
+            audio = load_audio(audio_path)
+            regions = detect_speech(audio)
+        except Exception as e:
+            logger.warning(f"VAD unavailable, transcribing full audio: {e}")
+            return self.transcribe(audio_path, language)
+
+        if not regions:
+            # Rather transcribe silence than lose quiet speech
+            logger.info("VAD found no speech, transcribing full audio")
+            return self.transcribe(audio_path, language)
+
+        speech = np.concatenate([audio[start:end] for start, end in regions])
+        logger.info(f"Transcribing {len(speech) / len(audio):.0%} of {audio_path.name} after VAD")
+
+        try:
+            segments, metadata = self._transcribe_audio(speech, language)
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            raise
+
+        _to_original_time(segments, regions)
+        metadata["duration"] = len(audio) / SAMPLE_RATE
+
+        logger.info(f"Transcription complete: {len(segments)} segments")
+        return segments, metadata
 
 
 class FastTranscriber:
@@ -156,29 +327,26 @@ class FastTranscriber:
             device: Device to use
         """
         self.model_name = model_name or Config.WHISPER_MODEL
-        self.device = device or Config.WHISPER_DEVICE
+        self.device = Config.resolve_device(device or Config.WHISPER_DEVICE)
         self.model = None
+        self.batched = None
         self._load_model()
 
     def _load_model(self):
         """Load faster-whisper model."""
         try:
-            from faster_whisper import WhisperModel
-            logger.info(f"Loading faster-whisper model: {self.model_name}")
-
-            # Use CPU by default for compatibility
-            compute_type = "int8" if self.device == "cpu" else "float16"
-
-            self.model = WhisperModel(
-                self.model_name,
-                device=self.device,
-                compute_type=compute_type
-            )
-            logger.info("Faster-whisper model loaded")
+            self.model = _load_faster_whisper_model(self.model_name, self.device)
         except Exception as e:
             logger.error(f"Failed to load faster-whisper: {e}")
             raise
 
+        try:
+            from faster_whisper import BatchedInferencePipeline
+            self.batched = BatchedInferencePipeline(model=self.model)
+        except ImportError:
+            # Installs older than the required faster-whisper 1.1.0
+            logger.warning("BatchedInferencePipeline unavailable, batching disabled")
+
     def transcribe(
         self,
         audio_path: str | Path,
@@ -201,27 +369,12 @@ class FastTranscriber:
 
         try:
             segments_generator, info = self.model.transcribe(
-                str(audio_path),
+                _decoded_audio_or_path(audio_path),
                 language=language,
                 word_timestamps=False
             )
 
-            segments = []
-            for seg in segments_generator:
-                segment = TranscriptSegment(
-                    start=seg.start,
-                    end=seg.end,
-                    text=seg.text.strip(),
-                    speaker="Speaker 1",
-                    confidence=0.9  # faster-whisper doesn't provide confidence
-                )
-                segments.append(segment)
-
-            metadata = {
-                "language": info.language,
-                "duration": info.duration,
-                "model": self.model_name
-            }
+            segments, metadata = self._collect(segments_generator, info)
 
             logger.info(f"Fast transcription complete: {len(segments)} segments")
             return segments, metadata
@@ -230,6 +383,78 @@ class FastTranscriber:
             logger.error(f"Fast transcription failed: {e}")
             raise
 
+    def transcribe_many(
+        self,
+        paths: List[str | Path],
+        batch_size: int = 16,
+        language: str = "en"
+    ) -> List[Tuple[List[TranscriptSegment], dict]]:
+        """Transcribe several audio files, batching segments through the model.
+
+        Each file is split by VAD into chunks that are decoded batch_size at
+        a time. Without a batched pipeline the files are transcribed one by one.
+
+        Args:
+            paths: Paths to audio files
+            batch_size: Number of audio chunks decoded per forward pass
+            language: Language code
+
+        Returns:
+            List of (segments, metadata) tuples in the order of paths
+        """
+        if self.batched is None:
+            return [self.transcribe(path, language) for path in paths]
+
+        results = []
+        for audio_path in map(Path, paths):
+            if not audio_path.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+            logger.info(f"Batch transcribing: {audio_path.name}")
+
+            try:
+                segments_generator, info = self.batched.transcribe(
+                    _decoded_audio_or_path(audio_path),
+                    language=language,
+                    batch_size=batch_size
+                )
+                results.append(self._collect(segments_generator, info))
+            except Exception as e:
+                logger.error(f"Batch transcription failed for {audio_path.name}: {e}")
+                raise
+
+        logger.info(f"Batch transcription complete: {len(results)} files")
+        return results
+
+    def _collect(self, segments_generator, info) -> Tuple[List[TranscriptSegment], dict]:
+        """Convert faster-whisper output to transcript segments and metadata.
+
+        Args:
+            segments_generator: Iterable of faster-whisper segments
+            info: faster-whisper TranscriptionInfo
+
+        Returns:
+            Tuple of (segments, metadata)
+        """
+        segments = [
+            TranscriptSegment.model_construct(
+                start=seg.start,
+                end=seg.end,
+                text=text,
+                speaker="Speaker 1",
+                confidence=0.9  # faster-whisper doesn't provide confidence
+            )
+            for seg in segments_generator
+            if (text := seg.text.strip())
+        ]
+
+        metadata = {
+            "language": info.language,
+            "duration": info.duration,
+            "model": self.model_name
+        }
+        return segments, metadata
+
 
 def get_transcriber(use_fast: bool = True) -> AudioTranscriber | FastTranscriber:
     """Get appropriate transcriber based on configuration.
@@ -0,0 +1,85 @@
+"""Background model loading so the first transcription doesn't pay for it."""
+
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+WHISPER_WARMUP = "faster-whisper"
+DIARIZATION_WARMUP = "diarization pipeline"
+
+# Loader threads by model name
+_threads: Dict[str, threading.Thread] = {}
+
+
+def _warm(name: str, load, arg, device_setting: str):
+    """Run a model loader, logging instead of raising on failure.
+
+    Args:
+        name: Model name for log messages
+        load: Cached loader to call as load(arg, device), positionally so
+            the call matches later cache lookups
+        arg: First loader argument
+        device_setting: Device setting, resolved here so an "auto" torch
+            import happens on this thread rather than the script thread
+    """
+    try:
+        load(arg, Config.resolve_device(device_setting))
+        logger.info(f"Warmed up {name}")
+    except Exception as e:
+        # The page loads the model again on demand and reports the error there
+        logger.warning(f"Could not warm up {name}: {e}")
+
+
+def warm_models(use_auth_token: Optional[str] = None) -> List[threading.Thread]:
+    """Load the Whisper and diarization models concurrently.
+
+    Both loads spend most of their time in file I/O and native code, so
+    running them in parallel roughly halves cold-start time.
+
+    Args:
+        use_auth_token: HuggingFace token for pyannote.audio models
+
+    Returns:
+        The started loader threads
+    """
+    from src.diarization import _get_pipeline
+    from src.transcription import _load_faster_whisper_model
+
+    targets = [
+        (WHISPER_WARMUP, _load_faster_whisper_model,
+         Config.WHISPER_MODEL, Config.WHISPER_DEVICE),
+        (DIARIZATION_WARMUP, _get_pipeline,
+         use_auth_token, Config.DIARIZATION_DEVICE),
+    ]
+
+    for name, load, *args in targets:
+        thread = threading.Thread(
+            target=_warm,
+            args=(name, load, *args),
+            name=f"warmup-{name}",
+            daemon=True
+        )
+        thread.start()
+        _threads[name] = thread
+
+    return list(_threads.values())
+
+
+def wait_for_warmup(*names: str, timeout: Optional[float] = None):
+    """Block until background model loads have finished.
+
+    Call before loading a model on demand, so a request that arrives
+    mid-warmup reuses the model instead of loading a second copy.
+
+    Args:
+        *names: Models to wait for (e.g. WHISPER_WARMUP); all if none given
+        timeout: Maximum seconds to wait per loader thread
+    """
+    for name in names or list(_threads):
+        thread = _threads.get(name)
+        if thread:
+            thread.join(timeout)
@@ -0,0 +1,66 @@
+"""Tests for audio module."""
+
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.audio import SAMPLE_RATE, load_audio
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    """Create a placeholder audio file."""
+    path = tmp_path / "meeting.wav"
+    path.write_bytes(b"RIFF")
+    return path
+
+
+def test_load_audio_16k_skips_librosa(monkeypatch, audio_file):
+    """Test that 16 kHz audio is decoded by soundfile alone and downmixed."""
+    stereo = np.array([[0.2, 0.4], [0.6, 0.8]], dtype=np.float32)
+    monkeypatch.setitem(sys.modules, "soundfile", SimpleNamespace(read=lambda *a, **k: (stereo, SAMPLE_RATE)))
+    monkeypatch.setitem(sys.modules, "librosa", None)  # Importing it would fail
+
+    audio = load_audio(audio_file)
+
+    assert audio.dtype == np.float32
+    assert audio.flags["C_CONTIGUOUS"]
+    np.testing.assert_allclose(audio, [0.3, 0.7])
+
+
+def test_load_audio_falls_back_to_librosa(monkeypatch, audio_file):
+    """Test that files soundfile cannot read are decoded by librosa."""
+    def unreadable(*args, **kwargs):
+        raise RuntimeError("Format not recognised")
+
+    decoded = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    monkeypatch.setitem(sys.modules, "soundfile", SimpleNamespace(read=unreadable))
+    monkeypatch.setitem(sys.modules, "librosa", SimpleNamespace(load=lambda *a, **k: (decoded, SAMPLE_RATE)))
+
+    assert load_audio(audio_file) is decoded
+
+
+def test_detect_speech_merges_short_pauses(monkeypatch):
+    """Test that frames become padded regions split only by long silences."""
+    from src.audio import detect_speech
+
+    # One second of audio in 30 ms frames; loud frames count as speech
+    audio = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    frame = SAMPLE_RATE * 30 // 1000
+    for i in (2, 3, 5, 30):
+        audio[i * frame:(i + 1) * frame] = 0.5
+
+    class FakeVad:
+        def __init__(self, mode):
+            pass
+
+        def is_speech(self, pcm, sample_rate):
+            return any(pcm)
+
+    monkeypatch.setitem(sys.modules, "webrtcvad", SimpleNamespace(Vad=FakeVad))
+
+    regions = detect_speech(audio, padding_ms=0)
+
+    assert regions == [(2 * frame, 6 * frame), (30 * frame, 31 * frame)]
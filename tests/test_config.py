@@ -0,0 +1,55 @@
+"""Tests for configuration module."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from src.config import Config
+
+
+def test_status_message_is_cached(monkeypatch):
+    """Test that the status message is built once until the cache is cleared."""
+    Config.get_status_message.cache_clear()
+    monkeypatch.setattr(Config, "WHISPER_MODEL", "tiny")
+
+    first = Config.get_status_message()
+    monkeypatch.setattr(Config, "WHISPER_MODEL", "large")
+
+    assert "Whisper Model: tiny" in first
+    assert Config.get_status_message() is first
+
+    Config.get_status_message.cache_clear()
+    assert "Whisper Model: large" in Config.get_status_message()
+
+    Config.get_status_message.cache_clear()
+
+
+def test_core_modules_do_not_import_heavy_deps():
+    """Test that importing core modules leaves ML libraries unloaded."""
+    code = (
+        "import sys\n"
+        "import src.config, src.schemas, src.storage, src.transcription, src.diarization\n"
+        "heavy = {'torch', 'librosa', 'pyannote', 'whisper', 'faster_whisper'}\n"
+        "print(sorted(heavy & {name.split('.')[0] for name in sys.modules}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_filler_pattern(monkeypatch):
+    """Test that the filler pattern matches whole words, including phrases."""
+    import re
+
+    monkeypatch.setattr(Config, "FILLER_WORDS", ("um", "you know", "you"))
+    pattern = re.compile(Config.filler_pattern(stretched=True), re.IGNORECASE)
+
+    assert pattern.search("Ummm, right").group() == "Ummm"
+    assert pattern.search("it was, you know, fine").group() == "you know"
+    assert pattern.search("the summary") is None
@@ -0,0 +1,133 @@
+"""Tests for diarization module."""
+
+import pytest
+
+from src.diarization import (
+    SpeakerDiarizer,
+    find_speaker_turns,
+    merge_adjacent_turns,
+    merge_transcript_and_diarization
+)
+from src.schemas import TranscriptSegment
+
+
+@pytest.fixture
+def diarizer(monkeypatch):
+    """Create diarizer without loading the pyannote pipeline."""
+    monkeypatch.setattr(SpeakerDiarizer, "_load_pipeline", lambda self: None)
+    return SpeakerDiarizer()
+
+
+@pytest.fixture
+def transcript():
+    """Create transcript segments."""
+    return [
+        TranscriptSegment(start=0.0, end=4.0, text="Hello everyone"),
+        TranscriptSegment(start=4.0, end=9.0, text="Thanks for joining"),
+        TranscriptSegment(start=9.0, end=12.0, text="Let's begin"),
+        TranscriptSegment(start=30.0, end=32.0, text="Anything else?")
+    ]
+
+
+def test_apply_diarization_max_overlap(diarizer, transcript):
+    """Test that each segment gets the speaker with the largest overlap."""
+    speaker_segments = [
+        (0.0, 5.0, "Speaker A"),
+        (5.0, 10.5, "Speaker B"),
+        (10.5, 12.0, "Speaker A")
+    ]
+
+    result = diarizer.apply_diarization(transcript, speaker_segments)
+
+    assert [seg.speaker for seg in result] == ["Speaker A", "Speaker B", "Speaker B", "Speaker 1"]
+    assert result is transcript  # Labels are applied in place
+
+
+def test_apply_diarization_tie_keeps_first_turn(diarizer, transcript):
+    """Test that equal overlaps resolve to the earliest speaker turn."""
+    speaker_segments = [
+        (0.0, 2.0, "Speaker A"),
+        (2.0, 4.0, "Speaker B")
+    ]
+
+    result = diarizer.apply_diarization(transcript[:1], speaker_segments)
+
+    assert result[0].speaker == "Speaker A"
+
+
+def test_apply_diarization_without_speakers(diarizer, transcript):
+    """Test that transcript is unchanged without speaker segments."""
+    result = diarizer.apply_diarization(transcript, [])
+
+    assert result == transcript
+
+
+def test_apply_diarization_unsorted_overlapping_turns(diarizer):
+    """Test that a long earlier turn is still found behind later short turns."""
+    transcript = [TranscriptSegment(start=20.0, end=30.0, text="Long monologue")]
+    speaker_segments = [
+        (22.0, 23.0, "Speaker B"),
+        (0.0, 60.0, "Speaker A"),
+        (25.0, 26.0, "Speaker C")
+    ]
+
+    result = diarizer.apply_diarization(transcript, speaker_segments)
+
+    assert result[0].speaker == "Speaker A"
+
+
+def test_merge_single_speaker_skips_diarizer(monkeypatch, transcript):
+    """Test that a single known speaker never constructs the diarizer."""
+    def fail(*args, **kwargs):
+        raise AssertionError("diarizer should not be created")
+
+    monkeypatch.setattr(SpeakerDiarizer, "__init__", fail)
+    transcript[1].speaker = "Speaker 2"
+
+    result = merge_transcript_and_diarization(transcript, "meeting.wav", num_speakers=1)
+
+    assert {seg.speaker for seg in result} == {"Speaker 1"}
+
+
+def test_find_speaker_turns_indices():
+    """Test that turn indices refer to the input order, -1 for no overlap."""
+    speaker_segments = [
+        (10.0, 20.0, "Speaker B"),
+        (0.0, 10.0, "Speaker A")
+    ]
+
+    indices = find_speaker_turns([(1.0, 3.0), (12.0, 15.0), (25.0, 26.0)], speaker_segments)
+
+    assert indices == [1, 0, -1]
+
+
+def test_diarize_falls_back_on_pipeline_error(diarizer, monkeypatch):
+    """Test that a pipeline runtime error falls back to heuristic turns."""
+    def failing_pipeline(*args, **kwargs):
+        raise RuntimeError("CUDA out of memory")
+
+    diarizer.pipeline = failing_pipeline
+    monkeypatch.setattr(diarizer, "_pipeline_input", lambda audio_path: str(audio_path))
+    monkeypatch.setattr("src.diarization.get_duration", lambda audio_path: 45.0)
+
+    result = diarizer.diarize("meeting.wav", num_speakers=2)
+
+    assert result[0] == (0.0, 30.0, "Speaker 1")
+
+
+def test_merge_adjacent_turns():
+    """Test that short gaps between same-speaker turns are bridged."""
+    speaker_segments = [
+        (0.0, 1.0, "Speaker A"),
+        (1.1, 2.0, "Speaker A"),
+        (2.0, 3.0, "Speaker B"),
+        (3.0, 4.0, "Speaker A"),
+        (5.0, 6.0, "Speaker A")
+    ]
+
+    assert merge_adjacent_turns(speaker_segments) == [
+        (0.0, 2.0, "Speaker A"),
+        (2.0, 3.0, "Speaker B"),
+        (3.0, 4.0, "Speaker A"),
+        (5.0, 6.0, "Speaker A")
+    ]
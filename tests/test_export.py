@@ -148,3 +148,87 @@ def test_timestamp_formatting(exporter):
     assert exporter._format_timestamp(0) == "00:00"
     assert exporter._format_timestamp(65) == "01:05"
     assert exporter._format_timestamp(3665) == "61:05"
+
+
+def test_export_bytes(exporter, sample_meeting, temp_exports_dir):
+    """Test in-memory export does not write to the exports directory."""
+    docx_options = ExportOptions(format="docx")
+    pdf_options = ExportOptions(format="pdf")
+
+    docx_name, docx_data = exporter.export_bytes(sample_meeting, docx_options)
+    pdf_name, pdf_data = exporter.export_bytes(sample_meeting, pdf_options)
+
+    assert docx_name.endswith(".docx")
+    assert docx_data[:2] == b"PK"  # DOCX is a zip archive
+    assert pdf_name.endswith(".pdf")
+    assert pdf_data.startswith(b"%PDF")
+    assert list(temp_exports_dir.iterdir()) == []
+
+
+def test_transcript_turns(exporter, sample_meeting):
+    """Test that consecutive segments by one speaker form a single turn."""
+    sample_meeting.transcript.append(
+        TranscriptSegment(start=65.0, end=70.0, text="Q1 went well.", speaker="Jane Doe")
+    )
+    options = ExportOptions(format="pdf")
+
+    turns = exporter._transcript_turns(sample_meeting, options)
+
+    assert turns == [
+        ("John Smith", ["[00:00] Welcome everyone to the meeting."]),
+        ("Jane Doe", ["[00:05] Thank you John. Let's get started.", "[01:05] Q1 went well."])
+    ]
+
+
+def test_export_pdf_escapes_markup(exporter, sample_meeting):
+    """Test that transcript text with markup characters renders."""
+    sample_meeting.transcript[0].text = "R&D costs <draft> vs. budget"
+    options = ExportOptions(format="pdf")
+
+    _, data = exporter.export_bytes(sample_meeting, options)
+
+    assert data.startswith(b"%PDF")
+
+
+def test_docx_tables(exporter, sample_meeting):
+    """Test DOCX metadata and action item table contents."""
+    from io import BytesIO
+    from docx import Document
+
+    _, data = exporter.export_bytes(sample_meeting, ExportOptions(format="docx"))
+    metadata_table, action_table = Document(BytesIO(data)).tables
+
+    assert [cell.text for cell in metadata_table.rows[0].cells] == ["Title:", "Q1 Review Meeting"]
+    assert [cell.text for cell in action_table.rows[0].cells] == ["Owner", "Action", "Due Date", "Status"]
+    assert action_table.rows[0].cells[0].paragraphs[0].runs[0].bold
+    assert [cell.text for cell in action_table.rows[2].cells] == [
+        "Jane Doe", "Update product roadmap document", "2026-02-25", "Open"
+    ]
+
+
+def test_docx_transcript_paragraphs(exporter, sample_meeting):
+    """Test DOCX transcript speaker headers and turn text."""
+    from io import BytesIO
+    from docx import Document
+
+    _, data = exporter.export_bytes(sample_meeting, ExportOptions(format="docx"))
+    paragraphs = Document(BytesIO(data)).paragraphs
+    texts = [p.text for p in paragraphs]
+
+    speaker_index = texts.index("\nJohn Smith")
+    assert paragraphs[speaker_index].runs[0].bold
+    assert texts[speaker_index + 1] == "[00:00] Welcome everyone to the meeting."
+    assert texts[-1].startswith("Generated by Meeting Minutes Generator")
+
+
+def test_export_many(exporter, sample_meeting, temp_exports_dir):
+    """Test batch export writes one file per meeting in input order."""
+    second = sample_meeting.model_copy(update={"title": "Q2 Planning"})
+    options = ExportOptions(format="pdf")
+
+    paths = exporter.export_many([sample_meeting, second], options)
+
+    assert [path.parent for path in paths] == [temp_exports_dir, temp_exports_dir]
+    assert "Q1_Review_Meeting" in paths[0].name
+    assert "Q2_Planning" in paths[1].name
+    assert all(path.read_bytes().startswith(b"%PDF") for path in paths)
@@ -90,12 +90,11 @@ def test_get_meeting(storage, sample_meeting):
 
 def test_list_meetings(storage, sample_meeting):
     """Test listing meetings."""
-    # Save multiple meetings
-    storage.save_meeting(sample_meeting)
-
     meeting2 = sample_meeting.model_copy()
     meeting2.title = "Sprint Planning"
-    storage.save_meeting(meeting2)
+
+    # Save multiple meetings
+    storage.save_meetings([sample_meeting, meeting2])
 
     # List all
     meetings = storage.list_meetings()
@@ -105,11 +104,9 @@ def test_list_meetings(storage, sample_meeting):
 
 def test_search_meetings(storage, sample_meeting):
     """Test searching meetings."""
-    storage.save_meeting(sample_meeting)
-
     meeting2 = sample_meeting.model_copy()
     meeting2.title = "Sprint Planning"
-    storage.save_meeting(meeting2)
+    storage.save_meetings([sample_meeting, meeting2])
 
     # Search by title
     results = storage.list_meetings(search="Sprint")
@@ -157,4 +154,215 @@ def test_get_statistics(storage, sample_meeting):
     stats = storage.get_statistics()
 
     assert stats["total_meetings"] == 2
-    assert stats["most_recent_date"] is not None
+    assert stats["most_recent_date"] == sample_meeting.date
+
+
+def test_get_statistics_empty(storage):
+    """Test statistics on an empty database."""
+    stats = storage.get_statistics()
+
+    assert stats["total_meetings"] == 0
+    assert stats["most_recent_date"] is None
+
+
+def test_sqlite_pragmas(storage):
+    """Test that connections are opened in WAL mode."""
+    with storage.engine.connect() as conn:
+        journal_mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+        busy_timeout = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+        mmap_size = conn.exec_driver_sql("PRAGMA mmap_size").scalar()
+
+    assert journal_mode == "wal"
+    assert busy_timeout == 5000
+    assert mmap_size == 268435456
+
+
+def test_save_meetings(storage, sample_meeting):
+    """Test saving several meetings in one call."""
+    meeting2 = sample_meeting.model_copy()
+    meeting2.title = "Sprint Planning"
+
+    meeting_ids = storage.save_meetings([sample_meeting, meeting2])
+
+    assert len(meeting_ids) == 2
+    assert storage.get_meeting(meeting_ids[0]).title == "Team Sync"
+    assert storage.get_meeting(meeting_ids[1]).title == "Sprint Planning"
+
+
+def test_list_meetings_skips_transcript(storage, sample_meeting):
+    """Test that listing leaves transcripts to get_meeting."""
+    meeting_id = storage.save_meeting(sample_meeting)
+
+    listed = storage.list_meetings()
+
+    assert listed[0].transcript == []
+    assert len(storage.get_meeting(meeting_id).transcript) == 2
+
+
+def test_update_replaces_segments(storage, sample_meeting):
+    """Test that saving an existing meeting rewrites its segments."""
+    meeting_id = storage.save_meeting(sample_meeting)
+
+    sample_meeting.id = meeting_id
+    sample_meeting.transcript = sample_meeting.transcript[:1]
+    storage.save_meeting(sample_meeting)
+
+    assert len(storage.get_meeting(meeting_id).transcript) == 1
+
+
+def test_legacy_transcript_json(storage, sample_meeting):
+    """Test that meetings saved as a transcript JSON blob still load."""
+    from src.schemas import TRANSCRIPT_ADAPTER
+
+    meeting_id = storage.save_meeting(sample_meeting)
+
+    # Rewrite the row the way older versions stored it
+    with storage.engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM transcript_segments WHERE meeting_id = ?", (meeting_id,))
+        conn.exec_driver_sql(
+            "UPDATE meetings SET transcript = ? WHERE id = ?",
+            (TRANSCRIPT_ADAPTER.dump_json(sample_meeting.transcript).decode(), meeting_id)
+        )
+
+    retrieved = storage.get_meeting(meeting_id)
+
+    assert [seg.text for seg in retrieved.transcript] == [seg.text for seg in sample_meeting.transcript]
+
+
+def test_search_full_text(storage, sample_meeting):
+    """Test full-text search across participants, updates and deletes."""
+    meeting_id = storage.save_meeting(sample_meeting)
+
+    assert storage.fts_enabled
+    assert len(storage.list_meetings(search="char")) == 1  # Prefix of Charlie
+    assert storage.list_meetings(search='"unbalanced (quote') == []
+
+    sample_meeting.id = meeting_id
+    sample_meeting.title = "Roadmap Review"
+    storage.save_meeting(sample_meeting)
+
+    assert storage.list_meetings(search="sync") == []
+    assert len(storage.list_meetings(search="roadmap review")) == 1
+
+    storage.delete_meeting(meeting_id)
+
+    assert storage.list_meetings(search="roadmap") == []
+
+
+def test_search_indexes_existing_meetings(temp_db, sample_meeting):
+    """Test that meetings saved before the FTS table existed are searchable."""
+    storage = MeetingStorage(db_path=temp_db)
+    storage.save_meeting(sample_meeting)
+
+    with storage.engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE meetings_fts")
+
+    reopened = MeetingStorage(db_path=temp_db)
+
+    assert len(reopened.list_meetings(search="team")) == 1
+
+
+def test_list_meetings_keyset_pagination(storage, sample_meeting):
+    """Test paging with a (date, id) cursor, including date ties."""
+    meetings = []
+    for i in range(5):
+        meeting = sample_meeting.model_copy()
+        meeting.title = f"Meeting {i}"
+        meeting.date = datetime(2026, 2, 18 + i // 2, 10, 0)  # Pairs share a date
+        meetings.append(meeting)
+    storage.save_meetings(meetings)
+
+    first_page = storage.list_meetings(limit=2)
+    last = first_page[-1]
+    second_page = storage.list_meetings(limit=2, before=(last.date, last.id))
+    last = second_page[-1]
+    third_page = storage.list_meetings(limit=2, before=(last.date, last.id))
+
+    titles = [m.title for m in first_page + second_page + third_page]
+    assert titles == ["Meeting 4", "Meeting 3", "Meeting 2", "Meeting 1", "Meeting 0"]
+
+
+def test_date_index_added_to_existing_db(temp_db, sample_meeting):
+    """Test that opening an older database adds the date index."""
+    storage = MeetingStorage(db_path=temp_db)
+    storage.save_meeting(sample_meeting)
+
+    with storage.engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_meetings_date")
+
+    reopened = MeetingStorage(db_path=temp_db)
+
+    with reopened.engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT id FROM meetings ORDER BY date DESC LIMIT 50"
+        ).fetchall()
+
+    assert any("ix_meetings_date" in row[-1] for row in plan)
+
+
+def test_save_meeting_with_unknown_id_inserts(storage, sample_meeting):
+    """Test that saving with an id missing from the database inserts it."""
+    sample_meeting.id = 42
+
+    assert storage.save_meeting(sample_meeting) == 42
+    assert storage.get_meeting(42).title == "Team Sync"
+
+
+def test_session_scope_shares_transaction(storage, sample_meeting):
+    """Test that operations in one session_scope commit or roll back together."""
+    with storage.session_scope() as session:
+        meeting_id = storage.save_meeting(sample_meeting, session=session)
+        assert storage.get_meeting(meeting_id, session=session).title == "Team Sync"
+
+    assert storage.get_statistics()["total_meetings"] == 1
+
+    with pytest.raises(RuntimeError):
+        with storage.session_scope() as session:
+            storage.delete_meeting(meeting_id, session=session)
+            raise RuntimeError("abort")
+
+    assert storage.get_meeting(meeting_id) is not None
+
+
+def test_save_meetings_mixed_new_and_existing(storage, sample_meeting):
+    """Test that a batch can update existing meetings and insert new ones."""
+    meeting_id = storage.save_meeting(sample_meeting)
+
+    existing = sample_meeting.model_copy()
+    existing.id = meeting_id
+    existing.title = "Renamed"
+    existing.transcript = sample_meeting.transcript[:1]
+    new = sample_meeting.model_copy()
+    new.title = "Sprint Planning"
+
+    meeting_ids = storage.save_meetings([new, existing])
+
+    assert meeting_ids[1] == meeting_id
+    assert storage.get_meeting(meeting_ids[0]).title == "Sprint Planning"
+    assert len(storage.get_meeting(meeting_ids[0]).transcript) == 2
+    assert storage.get_meeting(meeting_id).title == "Renamed"
+    assert len(storage.get_meeting(meeting_id).transcript) == 1
+    assert len(storage.list_meetings(search="renamed")) == 1
+
+
+def test_saving_listed_meeting_keeps_transcript(storage, sample_meeting):
+    """Test that a meeting from list_meetings can be saved without losing segments."""
+    meeting_id = storage.save_meeting(sample_meeting)
+    second = sample_meeting.model_copy()
+    second.title = "Sprint Planning"
+    storage.save_meeting(second)
+
+    listed = storage.list_meetings()
+    for meeting in listed:
+        meeting.title = f"{meeting.title} (edited)"
+    storage.save_meeting(listed[-1])
+    storage.save_meetings(listed[:1])
+
+    assert storage.get_meeting(meeting_id).title == "Team Sync (edited)"
+    assert all(len(storage.get_meeting(m.id).transcript) == 2 for m in listed)
+
+    # Explicitly assigned segments are still written
+    listed[-1].transcript = sample_meeting.transcript[:1]
+    storage.save_meeting(listed[-1])
+
+    assert len(storage.get_meeting(meeting_id).transcript) == 1
@@ -0,0 +1,252 @@
+"""Tests for summarizer module."""
+
+import pytest
+
+from src.config import Config
+from src.schemas import MeetingMinutes, TranscriptSegment
+from src.summarizer import MeetingSummarizer
+
+
+@pytest.fixture
+def summarizer(monkeypatch):
+    """Create summarizer without an LLM client."""
+    monkeypatch.setattr(MeetingSummarizer, "_initialize_client", lambda self: None)
+    monkeypatch.setattr(Config, "LLM_CACHE_ENABLED", False)
+    return MeetingSummarizer(provider="openai", model="test-model", api_key="test")
+
+
+RESPONSE = """{
+    "summary": ["Reviewed roadmap"],
+    "decisions": ["Ship in May"],
+    "action_items": [{"owner": "Alice", "task": "Draft plan", "due_date": null, "confidence": 0.9}],
+    "risks": []
+}"""
+
+
+def test_parse_response(summarizer):
+    """Test parsing a plain JSON response."""
+    minutes = summarizer._parse_response(RESPONSE)
+
+    assert minutes.summary == ["Reviewed roadmap"]
+    assert minutes.action_items[0].owner == "Alice"
+
+
+def test_parse_response_markdown_fence(summarizer):
+    """Test parsing JSON wrapped in a markdown code block."""
+    minutes = summarizer._parse_response(f"Here are the minutes:\n```json\n{RESPONSE}\n```")
+
+    assert minutes.decisions == ["Ship in May"]
+
+
+def test_parse_response_invalid(summarizer):
+    """Test that unparseable responses give empty minutes."""
+    minutes = summarizer._parse_response("not json at all")
+
+    assert minutes.summary == []
+    assert minutes.action_items == []
+
+
+def test_summarize_uses_cache(summarizer, monkeypatch, tmp_path):
+    """Test that a repeated prompt is answered from the cache."""
+    from src.llm_cache import LLMCache
+
+    calls = []
+
+    def fake_completion(prompt, on_partial=None):
+        calls.append(prompt)
+        return RESPONSE
+
+    summarizer.client = object()
+    summarizer.cache = LLMCache(tmp_path / "llm_cache.db")
+    monkeypatch.setattr(summarizer, "_get_completion", fake_completion)
+    transcript = [TranscriptSegment(start=0.0, end=2.0, text="Let's ship in May")]
+
+    first = summarizer.summarize(transcript)
+    second = summarizer.summarize(transcript)
+    summarizer.summarize(transcript, meeting_context="Different meeting")
+
+    assert first == second
+    assert len(calls) == 2
+
+
+def test_anthropic_system_prompt_is_cacheable(summarizer):
+    """Test that the Anthropic request marks the system prompt for caching."""
+    from types import SimpleNamespace
+
+    sent = {}
+
+    def create(**kwargs):
+        sent.update(kwargs)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=RESPONSE)],
+            usage=SimpleNamespace(cache_read_input_tokens=0, cache_creation_input_tokens=0)
+        )
+
+    summarizer = MeetingSummarizer(provider="anthropic", model="test-model", api_key="test")
+    summarizer.client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    assert summarizer._get_completion("prompt") == RESPONSE
+    assert sent["system"][0]["text"] == MeetingSummarizer.SYSTEM_PROMPT
+    assert sent["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_format_transcript_groups_speakers(summarizer):
+    """Test that consecutive segments share one speaker header."""
+    segments = [
+        TranscriptSegment(start=5.5, end=8.0, text="Hello", speaker="Alice"),
+        TranscriptSegment(start=8.0, end=9.0, text="Welcome", speaker="Alice"),
+        TranscriptSegment(start=65.9, end=70.0, text="Thanks", speaker="Bob"),
+        TranscriptSegment(start=70.0, end=72.0, text="One more thing", speaker="Alice")
+    ]
+
+    assert summarizer._format_transcript(segments) == (
+        "\n[00:05] Alice:\n  Hello\n  Welcome\n"
+        "\n[01:05] Bob:\n  Thanks\n"
+        "\n[01:10] Alice:\n  One more thing"
+    )
+
+
+def test_streaming_reports_partial_minutes(summarizer, monkeypatch):
+    """Test that streamed output is parsed as it arrives and in full at the end."""
+    from types import SimpleNamespace
+
+    def create(stream=False, **kwargs):
+        assert stream
+        assert kwargs["messages"][0]["content"] == MeetingSummarizer.SYSTEM_PROMPT
+        assert kwargs["response_format"] == {"type": "json_object"}
+        return (
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=RESPONSE[i:i + 10]))])
+            for i in range(0, len(RESPONSE), 10)
+        )
+
+    partials = []
+    monkeypatch.setattr(MeetingSummarizer, "PARTIAL_PARSE_INTERVAL", 40)
+    summarizer.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    transcript = [TranscriptSegment(start=0.0, end=2.0, text="Let's ship in May")]
+
+    minutes = summarizer.summarize(transcript, on_partial=partials.append)
+
+    assert minutes.decisions == ["Ship in May"]
+    assert partials[0] == {"summary": ["Reviewed roadmap"]}
+    assert partials[-1]["decisions"] == ["Ship in May"]
+
+
+def test_coalesce_merges_turns_and_strips_fillers(summarizer):
+    """Test that compression yields one filler-free segment per speaker turn."""
+    segments = [
+        TranscriptSegment(start=0.0, end=2.0, text="Um, so the plan is", speaker="Alice"),
+        TranscriptSegment(start=2.0, end=4.0, text="[inaudible]", speaker="Alice", confidence=0.5),
+        TranscriptSegment(start=4.0, end=6.0, text="to ship, uh, in May.", speaker="Alice"),
+        TranscriptSegment(start=6.0, end=7.0, text="Uhh.", speaker="Bob"),
+        TranscriptSegment(start=7.0, end=9.0, text="Sounds good to me", speaker="Alice")
+    ]
+
+    result = summarizer._coalesce(segments)
+
+    assert [(seg.start, seg.end, seg.text) for seg in result] == [
+        (0.0, 6.0, "so the plan is to ship, in May."),
+        (7.0, 9.0, "Sounds good to me")
+    ]
+
+
+def test_parse_response_truncated(summarizer):
+    """Test that output cut off mid-JSON keeps the complete parts."""
+    truncated = 'Sure:\n```json\n{"summary": ["Reviewed roadmap"], "decisions": ["Ship in M'
+
+    minutes = summarizer._parse_response(truncated)
+
+    assert minutes.summary == ["Reviewed roadmap"]
+    assert minutes.decisions == []
+
+
+def test_long_transcript_is_summarized_in_chunks(summarizer, monkeypatch):
+    """Test that long transcripts are summarized per chunk and merged once."""
+    import json
+    import threading
+
+    lock = threading.Lock()
+    prompts = []
+
+    def fake_completion(prompt, on_partial=None):
+        with lock:
+            prompts.append(prompt)
+        if prompt.startswith("Partial minutes"):
+            merged = json.loads(prompt.split("\n\n")[1])
+            assert len(merged["action_items"]) == 1  # Same task from both chunks
+            assert merged["summary"] == ["Part summary"]
+            return RESPONSE
+        return json.dumps({
+            "summary": ["Part summary"],
+            "action_items": [{"owner": "Alice", "task": "Draft plan"}]
+        })
+
+    monkeypatch.setattr(summarizer, "_get_completion", fake_completion)
+    monkeypatch.setattr(MeetingSummarizer, "MAX_SINGLE_CALL_TOKENS", 20)
+    monkeypatch.setattr(MeetingSummarizer, "CHUNK_TOKENS", 10)
+    summarizer.client = object()
+    transcript = [
+        TranscriptSegment(start=float(i), end=float(i + 1), text=f"Sentence number {i}")
+        for i in range(6)
+    ]
+
+    minutes = summarizer.summarize(transcript)
+
+    assert minutes.decisions == ["Ship in May"]
+    assert len(prompts) == 4  # Three chunks of two segments, then the merge
+    assert "part 1 of 3" in sorted(prompts)[0]
+
+
+@pytest.mark.parametrize("response", [
+    '{"summary": "not a list"}',
+    '{"action_items": [{"owner": "", "task": "Draft plan"}]}',
+    '["Reviewed roadmap"]'
+])
+def test_parse_response_schema_mismatch(summarizer, response):
+    """Test that valid JSON with the wrong shape gives empty minutes."""
+    assert summarizer._parse_response(response) == MeetingMinutes()
+
+
+def test_parse_response_defaults_missing_fields(summarizer):
+    """Test that omitted sections default to empty lists and no notes."""
+    minutes = summarizer._parse_response('{"summary": ["Reviewed roadmap"], "notes": null}')
+
+    assert minutes.summary == ["Reviewed roadmap"]
+    assert minutes.action_items == []
+    assert minutes.notes is None
+
+
+def test_summarize_ignores_corrupt_cache_entry(summarizer, monkeypatch, tmp_path):
+    """Test that an unreadable cache row is evicted and the LLM is called."""
+    from src.llm_cache import LLMCache
+
+    summarizer.client = object()
+    summarizer.cache = LLMCache(tmp_path / "llm_cache.db")
+    monkeypatch.setattr(summarizer, "_get_completion", lambda prompt, on_partial=None: RESPONSE)
+    transcript = [TranscriptSegment(start=0.0, end=2.0, text="Let's ship in May")]
+
+    keys = []
+    original_set = summarizer.cache.set
+    monkeypatch.setattr(summarizer.cache, "set", lambda key, response: (keys.append(key), original_set(key, response)))
+
+    summarizer.summarize(transcript)
+    original_set(keys[0], '{"summary": "not a list"')
+
+    minutes = summarizer.summarize(transcript)
+
+    assert minutes.decisions == ["Ship in May"]
+    assert summarizer.cache.get(keys[0]) == minutes.model_dump_json()
+
+
+def test_unusable_cache_is_skipped(monkeypatch, tmp_path):
+    """Test that a cache that can't be opened doesn't break the summarizer."""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setattr(MeetingSummarizer, "_initialize_client", lambda self: None)
+    monkeypatch.setattr(Config, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(Config, "LLM_CACHE_PATH", blocker / "llm_cache.db")
+
+    summarizer = MeetingSummarizer(provider="openai", model="test-model", api_key="test")
+
+    assert summarizer.cache is None
@@ -0,0 +1,135 @@
+"""Tests for transcription module."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.transcription import AudioTranscriber, FastTranscriber
+
+
+class FakeModel:
+    """Stand-in for a faster-whisper model or batched pipeline."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, language="en", **kwargs):
+        self.calls.append(kwargs)
+        segments = [
+            SimpleNamespace(start=0.0, end=2.0, text=" Hello "),
+            SimpleNamespace(start=2.0, end=3.0, text=" ")  # Silence decoded as blank
+        ]
+        return iter(segments), SimpleNamespace(language=language, duration=2.0)
+
+
+@pytest.fixture
+def audio_files(tmp_path):
+    """Create placeholder audio files."""
+    paths = [tmp_path / "a.wav", tmp_path / "b.wav"]
+    for path in paths:
+        path.write_bytes(b"")
+    return paths
+
+
+class FakeWhisper:
+    """Stand-in for an openai-whisper model."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append(kwargs)
+        return {"language": "en", "segments": [
+            {"start": 0.0, "end": 2.0, "text": " Hello there "},
+            {"start": 2.0, "end": 3.0, "text": ""}
+        ]}
+
+
+@pytest.fixture
+def transcriber(monkeypatch):
+    """Create whisper transcriber without loading a model."""
+    monkeypatch.setattr(AudioTranscriber, "_load_model", lambda self: None)
+    monkeypatch.setattr("src.transcription._decoded_audio_or_path", str)
+    transcriber = AudioTranscriber(model_name="base", device="cpu")
+    transcriber.model = FakeWhisper()
+    return transcriber
+
+
+@pytest.fixture
+def fast_transcriber(monkeypatch):
+    """Create fast transcriber without loading faster-whisper."""
+    monkeypatch.setattr(FastTranscriber, "_load_model", lambda self: None)
+    monkeypatch.setattr("src.transcription._decoded_audio_or_path", str)
+    transcriber = FastTranscriber(model_name="base", device="cpu")
+    transcriber.model = FakeModel()
+    return transcriber
+
+
+def test_transcribe_many_uses_batched_pipeline(fast_transcriber, audio_files):
+    """Test that each file goes through the batched pipeline."""
+    fast_transcriber.batched = FakeModel()
+
+    results = fast_transcriber.transcribe_many(audio_files, batch_size=8)
+
+    assert len(results) == 2
+    assert [seg.text for seg in results[0][0]] == ["Hello"]
+    assert results[1][1]["duration"] == 2.0
+    assert fast_transcriber.batched.calls == [{"batch_size": 8}, {"batch_size": 8}]
+    assert fast_transcriber.model.calls == []
+
+
+def test_transcribe_many_without_batched_pipeline(fast_transcriber, audio_files):
+    """Test that files are transcribed one by one without batching support."""
+    results = fast_transcriber.transcribe_many(audio_files)
+
+    assert len(results) == 2
+    assert len(fast_transcriber.model.calls) == 2
+
+
+def test_transcribe_skips_word_timestamps_by_default(transcriber, audio_files):
+    """Test that word alignment is only requested when asked for."""
+    segments, metadata = transcriber.transcribe(audio_files[0])
+    transcriber.transcribe(audio_files[0], word_timestamps=True)
+
+    assert [call["word_timestamps"] for call in transcriber.model.calls] == [False, True]
+    assert transcriber.model.calls[0]["fp16"] is False  # No half precision on CPU
+    assert [seg.text for seg in segments] == ["Hello there"]  # Blank segment dropped
+    assert metadata["duration"] == 3.0
+
+
+@pytest.mark.parametrize("text, start, end, expected", [
+    ("Hi", 0.0, 2.0, 0.6),
+    ("Hello there", 0.0, 0.3, 0.7),
+    ("[inaudible] words", 0.0, 2.0, 0.5),
+    ("Um, let's start", 0.0, 2.0, 0.8),
+    ("Hello there everyone", 0.0, 2.0, 0.95),  # "er" inside a word is not a filler
+])
+def test_calculate_confidence(transcriber, text, start, end, expected):
+    """Test confidence heuristics for segment text and duration."""
+    segment = {"text": text, "start": start, "end": end}
+
+    assert transcriber._calculate_confidence(segment) == expected
+
+
+def test_transcribe_with_vad_maps_times_back(transcriber, audio_files, monkeypatch):
+    """Test that only speech is transcribed and times refer to the original audio."""
+    import numpy as np
+
+    audio = np.zeros(10 * 16000, dtype=np.float32)
+    regions = [(16000, 3 * 16000), (6 * 16000, 8 * 16000)]  # 1-3 s and 6-8 s
+    monkeypatch.setattr("src.transcription.load_audio", lambda path: audio)
+    monkeypatch.setattr("src.transcription.detect_speech", lambda samples: regions)
+
+    def transcribe(samples, **kwargs):
+        assert len(samples) == 4 * 16000
+        return {"language": "en", "segments": [
+            {"start": 0.5, "end": 2.0, "text": "First part"},
+            {"start": 2.0, "end": 3.5, "text": "Second part"}
+        ]}
+
+    transcriber.model.transcribe = transcribe
+
+    segments, metadata = transcriber.transcribe_with_vad(audio_files[0])
+
+    assert [(seg.start, seg.end) for seg in segments] == [(1.5, 3.0), (6.0, 7.5)]
+    assert metadata["duration"] == 10.0
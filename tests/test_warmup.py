@@ -0,0 +1,75 @@
+"""Tests for warmup module."""
+
+import src.warmup as warmup
+
+
+def test_warm_models_loads_both_models(monkeypatch):
+    """Test that both loaders run and loader errors are swallowed."""
+    calls = []
+
+    def fake_whisper(model_name, device):
+        calls.append(("whisper", model_name))
+
+    def failing_pipeline(use_auth_token, device):
+        calls.append(("pipeline", use_auth_token))
+        raise OSError("no token")
+
+    monkeypatch.setattr("src.transcription._load_faster_whisper_model", fake_whisper)
+    monkeypatch.setattr("src.diarization._get_pipeline", failing_pipeline)
+    monkeypatch.setattr(warmup.Config, "WHISPER_MODEL", "tiny")
+    monkeypatch.setattr(warmup, "_threads", {})
+
+    threads = warmup.warm_models()
+    warmup.wait_for_warmup(timeout=5)
+
+    assert len(threads) == 2
+    assert not any(thread.is_alive() for thread in threads)
+    assert sorted(calls) == [("pipeline", None), ("whisper", "tiny")]
+
+
+def test_wait_for_warmup_only_named_models(monkeypatch):
+    """Test that waiting for Whisper doesn't block on the diarization load."""
+    import threading
+
+    release = threading.Event()
+
+    def fake_whisper(model_name, device):
+        pass
+
+    def slow_pipeline(use_auth_token, device):
+        release.wait(5)
+
+    monkeypatch.setattr("src.transcription._load_faster_whisper_model", fake_whisper)
+    monkeypatch.setattr("src.diarization._get_pipeline", slow_pipeline)
+    monkeypatch.setattr(warmup, "_threads", {})
+
+    warmup.warm_models()
+    warmup.wait_for_warmup(warmup.WHISPER_WARMUP, timeout=5)
+
+    assert not warmup._threads[warmup.WHISPER_WARMUP].is_alive()
+    assert warmup._threads[warmup.DIARIZATION_WARMUP].is_alive()
+
+    release.set()
+    warmup.wait_for_warmup(timeout=5)
+
+
+def test_devices_resolved_on_warmup_threads(monkeypatch):
+    """Test that "auto" device resolution (a torch import) stays off the caller's thread."""
+    import threading
+
+    resolved_on = []
+
+    def fake_resolve(device):
+        resolved_on.append(threading.current_thread().name)
+        return "cpu"
+
+    monkeypatch.setattr(warmup.Config, "resolve_device", fake_resolve)
+    monkeypatch.setattr("src.transcription._load_faster_whisper_model", lambda model_name, device: None)
+    monkeypatch.setattr("src.diarization._get_pipeline", lambda use_auth_token, device: None)
+    monkeypatch.setattr(warmup, "_threads", {})
+
+    warmup.warm_models()
+    warmup.wait_for_warmup(timeout=5)
+
+    assert len(resolved_on) == 2
+    assert threading.current_thread().name not in resolved_on